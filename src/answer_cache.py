@@ -0,0 +1,266 @@
+"""Module for caching answers on disk, keyed by the solution source and input."""
+
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+from src.optional_numpy import np
+
+NUMPY_VERSION = None if np is None else np.__version__
+SOURCE_DIRECTORY = Path(__file__).parent
+CACHE_DIRECTORY = Path(".aoc_cache", "answers")
+MAX_ENTRIES = 1024
+BYPASS_VARIABLE = "AOC_NO_CACHE"
+
+
+def cache_enabled() -> bool:
+    """Checks if the cache is enabled, which it is unless the bypass
+    environment variable is set to a non-empty value.
+
+    Returns
+    -------
+    bool: True if the cache is enabled, False if not.
+    """
+    return not os.environ.get(BYPASS_VARIABLE)
+
+
+def imported_modules(tree: ast.Module) -> Iterator[str]:
+    """Finds the names of the modules that may be imported by a module.
+
+    Parameters
+    ----------
+    tree: ast.Module
+        The syntax tree of the module.
+
+    Returns
+    -------
+    Iterator[str]: The imported names, which for imports of the form
+    "from package import name" include both the package and "package.name".
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            yield node.module
+            yield from (f"{node.module}.{alias.name}" for alias in node.names)
+
+
+def source_paths(module_name: str) -> list[Path]:
+    """Finds the source files of a src module and of every src module it
+    imports, directly or indirectly.
+
+    Parameters
+    ----------
+    module_name: str
+        The name of the module, such as "src.day_05".
+
+    Returns
+    -------
+    list[Path]: The source files, ordered by module name.
+    """
+    paths: dict[str, Path] = {}
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        package, _, relative_name = name.partition(".")
+        path = SOURCE_DIRECTORY.joinpath(*relative_name.split(".")).with_suffix(".py")
+        if package != "src" or name in paths or not path.is_file():
+            continue
+        paths[name] = path
+        pending.extend(imported_modules(ast.parse(path.read_bytes())))
+    return [paths[name] for name in sorted(paths)]
+
+
+def source_digest(module: ModuleType) -> str:
+    """The digest of the source of a solution, which changes whenever the
+    source of the solution, the source of any src module it imports or the
+    version of NumPy changes.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    Returns
+    -------
+    str: The hexadecimal SHA-256 digest of the sources and NumPy version.
+    """
+    paths = source_paths(module.__name__)
+    if not paths:
+        raise ValueError(f"{module.__name__} has no source file in src")
+
+    digest = hashlib.sha256()
+    for source_path in paths:
+        digest.update(source_path.read_bytes())
+    digest.update(f"\0numpy={NUMPY_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def cache_key(module: ModuleType, parts: tuple[int, ...], input_data: str) -> str:
+    """The key of the answers to parts of a problem, which changes whenever
+    the source digest of the solution or the input data changes.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    parts: tuple[int, ...]
+        The parts of the problem.
+
+    input_data: str
+        The input data of the parts.
+
+    Returns
+    -------
+    str: The hexadecimal SHA-256 digest of the source digest, parts and input.
+    """
+    digest = hashlib.sha256(source_digest(module).encode())
+    digest.update(f"\0{'+'.join(map(str, parts))}\0".encode())
+    digest.update(input_data.encode())
+    return digest.hexdigest()
+
+
+def load_answers(key: str, directory: Path = CACHE_DIRECTORY) -> list[Any] | None:
+    """Loads in cached answers, marking them as recently used.
+
+    Parameters
+    ----------
+    key: str
+        The key of the answers.
+
+    directory: Path
+        The directory of the cache.
+
+    Returns
+    -------
+    list[Any] | None: The answers, or None if they are not cached.
+    """
+    path = directory / f"{key}.json"
+    try:
+        answers: list[Any] = json.loads(path.read_text(encoding="utf-8"))
+        os.utime(path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return answers
+
+
+def store_answers(
+    key: str,
+    answers: list[Any],
+    directory: Path = CACHE_DIRECTORY,
+    max_entries: int = MAX_ENTRIES,
+) -> None:
+    """Stores answers in the cache, then evicts the least recently used
+    answers beyond the maximum number of entries.
+
+    The answers are written to a temporary file that replaces the entry, so
+    that concurrent runners never read a partially written entry.
+
+    Parameters
+    ----------
+    key: str
+        The key of the answers.
+
+    answers: list[Any]
+        The answers to store.
+
+    directory: Path
+        The directory of the cache.
+
+    max_entries: int
+        The maximum number of entries kept in the cache.
+
+    Returns
+    -------
+    None
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary_path = directory / f"{key}.{os.getpid()}.tmp"
+    temporary_path.write_text(json.dumps(answers), encoding="utf-8")
+    os.replace(temporary_path, directory / f"{key}.json")
+    evict(directory, max_entries)
+
+
+def evict(
+    directory: Path = CACHE_DIRECTORY,
+    max_entries: int = MAX_ENTRIES,
+    pattern: str = "*.json",
+) -> None:
+    """Removes the least recently used entries beyond the maximum number of
+    entries.
+
+    Parameters
+    ----------
+    directory: Path
+        The directory of the cache.
+
+    max_entries: int
+        The maximum number of entries kept in the cache.
+
+    pattern: str
+        The glob pattern matching the entry files in the directory.
+
+    Returns
+    -------
+    None
+    """
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue
+
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        path.unlink(missing_ok=True)
+
+
+def cached_answers(
+    module: ModuleType,
+    parts: tuple[int, ...],
+    input_data: str,
+    solve: Callable[[], list[Any]],
+    directory: Path = CACHE_DIRECTORY,
+) -> tuple[list[Any], bool]:
+    """Loads in the answers to parts of a problem from the cache, solving and
+    storing them if they are not cached.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    parts: tuple[int, ...]
+        The parts of the problem.
+
+    input_data: str
+        The input data of the parts.
+
+    solve: Callable[[], list[Any]]
+        Solves the parts, returning an answer for each part.
+
+    directory: Path
+        The directory of the cache.
+
+    Returns
+    -------
+    tuple[list[Any], bool]: The answers and whether they were loaded from the
+    cache.
+    """
+    if not cache_enabled():
+        return solve(), False
+
+    key = cache_key(module, parts, input_data)
+    answers = load_answers(key, directory)
+    if answers is not None:
+        return answers, True
+
+    answers = solve()
+    store_answers(key, answers, directory)
+    return answers, False
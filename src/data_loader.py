@@ -0,0 +1,67 @@
+"""Module for loading input data files through a shared memory-mapped cache."""
+
+import mmap
+import os
+
+CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def read_mapped(file_path: str, size: int) -> str:
+    """Reads a file by memory-mapping it and decoding the mapped bytes.
+
+    Parameters
+    ----------
+    file_path: str
+        The file path of the data.
+
+    size: int
+        The size of the file in bytes, as empty files cannot be mapped.
+
+    Returns
+    -------
+    str: The data in the file with trailing whitespace removed.
+    """
+    if size == 0:
+        return ""
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            return str(mapped_file, "utf-8").rstrip()
+
+
+def load_text(file_path: str | os.PathLike[str]) -> str | None:
+    """Loads in the data from a file, reading each file only once for as long
+    as its modification time and size are unchanged.
+
+    Parameters
+    ----------
+    file_path: str | os.PathLike[str]
+        The file path of the data.
+
+    Returns
+    -------
+    str | None: The data in the file with trailing whitespace removed, or None
+    if the file does not exist.
+    """
+    path = os.fspath(file_path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    version = (stat.st_mtime_ns, stat.st_size)
+    if path in CACHE and CACHE[path][0] == version:
+        return CACHE[path][1]
+
+    data = read_mapped(path, stat.st_size)
+    CACHE[path] = (version, data)
+    return data
+
+
+def clear_cache() -> None:
+    """Removes every file from the cache.
+
+    Returns
+    -------
+    None
+    """
+    CACHE.clear()
@@ -1,5 +1,13 @@
 """Module for implementing the solution to the problem set on day 1."""
 
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+from src.optional_numpy import np
+
+if TYPE_CHECKING:
+    from src.optional_numpy import ByteArray
+
 DIGIT_NAMES = [
     "zero",
     "one",
@@ -14,30 +22,127 @@ DIGIT_NAMES = [
 ]
 
 
-def remove_letters(string: str) -> str:
-    return "".join(character for character in string if not character.isalpha())
+NON_DIGIT_BYTES = bytes(byte for byte in range(256) if byte not in b"0123456789\n")
+
+
+@dataclass
+class TrieNode:
+    children: dict[str, Self] = field(default_factory=dict)
+    digit: int | None = None
+
+    @classmethod
+    def from_words(cls, words: dict[str, int]) -> Self:
+        root = cls()
+        for word, digit in words.items():
+            node = root
+            for character in word:
+                node = node.children.setdefault(character, cls())
+            node.digit = digit
+        return root
+
+    def match(self, line: str, index: int, step: int) -> int | None:
+        node = self
+        while 0 <= index < len(line) and (child := node.children.get(line[index])):
+            if child.digit is not None:
+                return child.digit
+            node = child
+            index += step
+        return None
+
+
+@dataclass
+class DigitScanner:
+    digit_words: dict[str, int]
+
+    def __post_init__(self) -> None:
+        self.forward_trie = TrieNode.from_words(self.digit_words)
+        self.backward_trie = TrieNode.from_words(
+            {word[::-1]: digit for word, digit in self.digit_words.items()}
+        )
+
+    @classmethod
+    def with_digit_names(cls) -> Self:
+        digit_words = {str(digit): digit for digit in range(10)}
+        digit_words |= {
+            digit_name: digit for digit, digit_name in enumerate(DIGIT_NAMES)
+        }
+        return cls(digit_words)
+
+    def first_digit(self, line: str) -> int:
+        for index in range(len(line)):
+            if (digit := self.forward_trie.match(line, index, 1)) is not None:
+                return digit
+        raise ValueError(f"No digit found in line: {line}")
+
+    def last_digit(self, line: str) -> int:
+        for index in reversed(range(len(line))):
+            if (digit := self.backward_trie.match(line, index, -1)) is not None:
+                return digit
+        raise ValueError(f"No digit found in line: {line}")
+
+    def calibration_value(self, line: str) -> int:
+        return 10 * self.first_digit(line) + self.last_digit(line)
+
+
+def calculate_digit_sum_array(buffer: "ByteArray") -> int:
+    digit_positions = np.flatnonzero((buffer >= ord("0")) & (buffer <= ord("9")))
+    line_ends = np.append(np.flatnonzero(buffer == ord("\n")), len(buffer))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+
+    first_indices = np.searchsorted(digit_positions, line_starts)
+    last_indices = np.searchsorted(digit_positions, line_ends) - 1
+    has_digits = first_indices <= last_indices
+
+    first_digits = buffer[digit_positions[first_indices[has_digits]]] - ord("0")
+    last_digits = buffer[digit_positions[last_indices[has_digits]]] - ord("0")
+    return int(10 * first_digits.sum(dtype=np.int64) + last_digits.sum(dtype=np.int64))
+
+
+def calculate_digit_sum_bytes(data: bytes) -> int:
+    if np is not None:
+        return calculate_digit_sum_array(np.frombuffer(data, dtype=np.uint8))
+
+    digit_lines = data.translate(None, NON_DIGIT_BYTES).split(b"\n")
+    return sum(
+        10 * (digits[0] - ord("0")) + digits[-1] - ord("0")
+        for digits in digit_lines
+        if digits
+    )
+
+
+def calculate_digit_sum_from_file(file_path: str) -> int:
+    if np is not None:
+        return calculate_digit_sum_array(np.fromfile(file_path, dtype=np.uint8))
+
+    with open(file_path, "rb") as f:
+        return calculate_digit_sum_bytes(f.read())
 
 
 def calculate_digit_sum(input_data: str) -> int:
-    digits = (remove_letters(line) for line in input_data.splitlines())
-    first_and_last_digits = (int(digit[0] + digit[-1]) for digit in digits)
-    return sum(first_and_last_digits)
+    return calculate_digit_sum_bytes(input_data.encode())
+
+
+def parse(input_data: str) -> bytes:
+    return input_data.encode()
+
+
+def solve_part_1(data: bytes) -> int:
+    return calculate_digit_sum_bytes(data)
 
 
-def convert_digit_names(input_data: str) -> str:
-    processed_input = input_data
+def solve_part_2(data: bytes) -> int:
+    scanner = DigitScanner.with_digit_names()
+    return sum(scanner.calibration_value(line) for line in data.decode().splitlines())
 
-    for digit, digit_name in enumerate(DIGIT_NAMES):
-        replace_text = digit_name + str(digit) + digit_name
-        processed_input = processed_input.replace(digit_name, replace_text)
 
-    return processed_input
+def solve(input_data: str) -> tuple[int, int]:
+    data = parse(input_data)
+    return solve_part_1(data), solve_part_2(data)
 
 
 def part_1_answer(input_data: str) -> int:
-    return calculate_digit_sum(input_data)
+    return solve_part_1(parse(input_data))
 
 
 def part_2_answer(input_data: str) -> int:
-    processed_input = convert_digit_names(input_data)
-    return calculate_digit_sum(processed_input)
+    return solve_part_2(parse(input_data))
@@ -1,11 +1,18 @@
 """Module for implementing the solution to the problem set on day 2."""
 
-import math
-import operator
-from dataclasses import dataclass
+import re
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
-from functools import partial, reduce
-from typing import Iterator, Self
+from functools import cached_property
+from typing import Self
+
+from src.model_cache import pack_arrays, unpack_arrays
+
+DRAW_PATTERN = re.compile("([0-9]+) ([a-z]+)")
+
+Limits = tuple[int, int, int]
 
 
 @dataclass
@@ -19,80 +26,158 @@ class Cubes(Enum):
     BLUE = Cube(max_amount=14)
 
 
-@dataclass
-class CubeCollection:
-    cube: Cube
-    amount: int
+def create_column() -> "array[int]":
+    return array("I")
 
-    def __post_init__(self) -> None:
-        self.possible = self.amount <= self.cube.max_amount
+
+@dataclass
+class MaximaIndex:
+    reds: list[int]
+    green_ranks: list[int]
+    blues: list[int]
+    ids: list[int]
+    green_axis: list[int]
+    node_blues: list[list[int]]
 
     @classmethod
-    def from_string(cls, string: str) -> Self:
-        amount, colour = string.split(" ")
-        cube = Cubes[colour.upper()].value
-        return cls(cube, int(amount))
+    def from_columns(cls, ids: "array[int]", columns: list["array[int]"]) -> Self:
+        order = sorted(range(len(ids)), key=columns[0].__getitem__)
+        reds, greens, blues, game_ids = (
+            [column[game] for game in order] for column in (*columns, ids)
+        )
+        green_axis = sorted(set(greens))
+        green_ranks = [bisect_right(green_axis, green) for green in greens]
+
+        node_blues: list[list[int]] = [[] for _ in range(len(green_axis) + 1)]
+        for green_rank, blue in zip(green_ranks, blues):
+            node = green_rank
+            while node < len(node_blues):
+                node_blues[node].append(blue)
+                node += node & -node
+
+        node_blues = [sorted(set(blues_in_node)) for blues_in_node in node_blues]
+        return cls(reds, green_ranks, blues, game_ids, green_axis, node_blues)
+
+    def possible_id_sums(self, limits: list[Limits]) -> list[int]:
+        node_sums = [[0] * (len(blues) + 1) for blues in self.node_blues]
+        id_sums = [0] * len(limits)
+        game = 0
+
+        for query in sorted(range(len(limits)), key=lambda query: limits[query][0]):
+            red_limit, green_limit, blue_limit = limits[query]
+            while game < len(self.reds) and self.reds[game] <= red_limit:
+                self.add_game(node_sums, game)
+                game += 1
+            id_sums[query] = self.dominated_id_sum(node_sums, green_limit, blue_limit)
+
+        return id_sums
+
+    def add_game(self, node_sums: list[list[int]], game: int) -> None:
+        node, blue = self.green_ranks[game], self.blues[game]
+        while node < len(node_sums):
+            blue_node = bisect_right(self.node_blues[node], blue)
+            while blue_node < len(node_sums[node]):
+                node_sums[node][blue_node] += self.ids[game]
+                blue_node += blue_node & -blue_node
+            node += node & -node
+
+    def dominated_id_sum(
+        self, node_sums: list[list[int]], green_limit: int, blue_limit: int
+    ) -> int:
+        id_sum = 0
+        node = bisect_right(self.green_axis, green_limit)
+        while node > 0:
+            blue_node = bisect_right(self.node_blues[node], blue_limit)
+            while blue_node > 0:
+                id_sum += node_sums[node][blue_node]
+                blue_node -= blue_node & -blue_node
+            node -= node & -node
+        return id_sum
 
 
 @dataclass
-class Set:
-    cube_collections: list[CubeCollection]
+class GameTable:
+    ids: "array[int]" = field(default_factory=create_column)
+    columns: dict[Cubes, "array[int]"] = field(
+        default_factory=lambda: {cube: create_column() for cube in Cubes}
+    )
 
-    def __post_init__(self) -> None:
-        self.possible = int(all(cube.possible for cube in self.cube_collections))
+    @classmethod
+    def from_string(cls, input_data: str) -> Self:
+        table = cls()
+        for line in input_data.splitlines():
+            table.add_game(line)
+        return table
 
     @classmethod
-    def from_string(cls, string: str) -> Self:
-        return cls([CubeCollection.from_string(cube) for cube in string.split(", ")])
+    def from_bytes(cls, data: bytes) -> Self:
+        ids, *columns = unpack_arrays(cls.__name__, data)
+        return cls(ids, dict(zip(Cubes, columns)))
+
+    def to_bytes(self) -> bytes:
+        return pack_arrays(type(self).__name__, [self.ids, *self.columns.values()])
+
+    def add_game(self, line: str) -> None:
+        info, game = line.split(": ")
+        max_amounts = dict.fromkeys(Cubes, 0)
+
+        for amount, colour in DRAW_PATTERN.findall(game):
+            cube = Cubes[colour.upper()]
+            max_amounts[cube] = max(max_amounts[cube], int(amount))
+
+        self.ids.append(int(info.split(" ")[1]))
+        for cube, max_amount in max_amounts.items():
+            self.columns[cube].append(max_amount)
+
+    @cached_property
+    def maxima_index(self) -> MaximaIndex:
+        return MaximaIndex.from_columns(self.ids, list(self.columns.values()))
+
+    def possible_id_sum(self, limits: Limits | None = None) -> int:
+        if limits is None:
+            red, green, blue = (cube.value.max_amount for cube in Cubes)
+            limits = (red, green, blue)
+        red_limit, green_limit, blue_limit = limits
+        maxima = zip(self.ids, *self.columns.values())
+        return sum(
+            game_id
+            for game_id, red, green, blue in maxima
+            if red <= red_limit and green <= green_limit and blue <= blue_limit
+        )
+
+    def possible_id_sums(self, limits: list[Limits]) -> list[int]:
+        return self.maxima_index.possible_id_sums(limits)
 
+    @property
+    def total_power(self) -> int:
+        red, green, blue = (self.columns[cube] for cube in Cubes)
+        return sum(r * g * b for r, g, b in zip(red, green, blue))
 
-@dataclass
-class Game:
-    number: int
-    sets: list[Set]
 
-    def __post_init__(self) -> None:
-        self.possible = int(all(set.possible for set in self.sets))
-        nested_cube_collections = (set.cube_collections for set in self.sets)
-        self.cube_collections = reduce(operator.add, nested_cube_collections)
+def create_games(input_data: str) -> GameTable:
+    return GameTable.from_string(input_data)
 
-    @classmethod
-    def from_string(cls, string: str) -> Self:
-        info, game = string.split(": ")
-        number = int(info.split(" ")[1])
-        sets = [Set.from_string(set) for set in game.split("; ")]
-        return cls(number, sets)
-
-    @staticmethod
-    def filter_cube_to_colour(
-        coloured_cube: Cube, cube_collection: CubeCollection
-    ) -> Iterator[CubeCollection]:
-        if cube_collection.cube is coloured_cube:
-            yield cube_collection
-
-    def filter_cubes_to_colour(self, coloured_cube: Cube) -> Iterator[CubeCollection]:
-        filter_cube_to_colour = partial(self.filter_cube_to_colour, coloured_cube)
-        for cube_collection in self.cube_collections:
-            yield from filter_cube_to_colour(cube_collection)
-
-    def max_amount(self, coloured_cube: Cube) -> int:
-        cube_collections = self.filter_cubes_to_colour(coloured_cube)
-        return max(cube_collection.amount for cube_collection in cube_collections)
 
-    @property
-    def power(self) -> int:
-        return math.prod(self.max_amount(cube.value) for cube in Cubes)
+def parse(input_data: str) -> GameTable:
+    return create_games(input_data)
+
+
+def solve_part_1(games: GameTable) -> int:
+    return games.possible_id_sum()
+
+
+def solve_part_2(games: GameTable) -> int:
+    return games.total_power
 
 
-def create_games(input_data: str) -> list[Game]:
-    return [Game.from_string(game) for game in input_data.splitlines()]
+def solve(input_data: str) -> tuple[int, int]:
+    games = parse(input_data)
+    return solve_part_1(games), solve_part_2(games)
 
 
 def part_1_answer(input_data: str) -> int:
-    games = create_games(input_data)
-    return sum(game.number * game.possible for game in games)
+    return solve_part_1(parse(input_data))
 
 
 def part_2_answer(input_data: str) -> int:
-    games = create_games(input_data)
-    return sum(game.power for game in games)
+    return solve_part_2(parse(input_data))
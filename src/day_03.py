@@ -2,117 +2,325 @@
 
 import math
 import re
-from dataclasses import dataclass
-from typing import Iterator, Self
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterable, Iterator, Self, TextIO
 
+from src.model_cache import pack_arrays, unpack_arrays
 
-@dataclass
-class Number:
-    number: int
+ELEMENT_PATTERN = re.compile("([0-9]+)|([^0-9.\r\n])")
+
+Position = tuple[int, int]
+Span = tuple[int, int, int]
+
+
+def create_column(typecode: str = "I") -> "array[int]":
+    return array(typecode)
 
-    def __hash__(self) -> int:
-        return id(self)
 
+def flatten_positions(positions: list[Position]) -> "array[int]":
+    return array("I", chain.from_iterable(positions))
 
-Element = Number | str | None
+
+def unflatten_positions(values: "array[int]") -> list[Position]:
+    return list(zip(values[::2], values[1::2]))
 
 
 @dataclass
-class Symbol:
-    gear: bool
-    adjacent_elements: set[Element]
+class SpanIndex:
+    row_offsets: "array[int]" = field(default_factory=lambda: array("I", [0]))
+    starts: "array[int]" = field(default_factory=create_column)
+    ends: "array[int]" = field(default_factory=create_column)
+    values: "array[int]" = field(default_factory=lambda: create_column("Q"))
 
-    @property
-    def adjacent_numbers(self) -> list[int]:
-        return [
-            adjacent_element.number
-            for adjacent_element in self.adjacent_elements
-            if isinstance(adjacent_element, Number)
-        ]
+    def __len__(self) -> int:
+        return len(self.values)
 
     @property
-    def part_number(self) -> int:
-        return sum(self.adjacent_numbers)
+    def num_rows(self) -> int:
+        return len(self.row_offsets) - 1
 
-    @property
-    def gear_ratio(self) -> int:
-        if self.gear and len(self.adjacent_numbers) == 2:
-            return math.prod(self.adjacent_numbers)
-        return 0
+    def end_row(self) -> None:
+        self.row_offsets.append(len(self))
+
+    def add_span(self, start: int, end: int, value: int) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.values.append(value)
+
+    def adjacent_spans(self, row: int, column: int) -> Iterator[int]:
+        for adjacent_row in range(max(row - 1, 0), min(row + 2, self.num_rows)):
+            low = self.row_offsets[adjacent_row]
+            high = self.row_offsets[adjacent_row + 1]
+            span = bisect_left(self.ends, column, low, high)
+            while span < high and self.starts[span] <= column + 1:
+                yield span
+                span += 1
 
 
 @dataclass
 class Grid:
-    grid: list[list[Element]]
+    spans: SpanIndex
+    symbols: list[Position]
+    gears: list[Position]
 
     @classmethod
     def from_string(cls, input_data: str) -> Self:
-        return cls([cls.process_line(line) for line in input_data.splitlines()])
+        spans, symbols, gears = SpanIndex(), [], []
+        row, line_start, position = 0, 0, 0
 
-    @staticmethod
-    def process_string(string: str) -> Iterator[Element]:
-        if len(string) == 0:
-            return
+        for element in ELEMENT_PATTERN.finditer(input_data):
+            if new_lines := input_data.count("\n", position, element.start()):
+                for _ in range(new_lines):
+                    spans.end_row()
+                row += new_lines
+                line_start = input_data.rfind("\n", position, element.start()) + 1
+            position = element.start()
 
-        if string == ".":
-            yield None
-            return
+            start, end = position - line_start, element.end() - line_start
+            if element.group(1):
+                spans.add_span(start, end, int(element.group(1)))
+                continue
+            symbols.append((row, start))
+            if element.group(2) == "*":
+                gears.append((row, start))
 
-        if not string.isdigit():
-            yield string
-            return
+        for _ in range(input_data.count("\n", position) + 1):
+            spans.end_row()
 
-        number = Number(int(string))
-        for _ in string:
-            yield number
+        return cls(spans, symbols, gears)
 
     @classmethod
-    def process_line(cls, line: str) -> list[Element]:
-        split_line = re.split("([^0-9])", line)
+    def from_bytes(cls, data: bytes) -> Self:
+        *span_arrays, symbols, gears = unpack_arrays(cls.__name__, data)
+        return cls(
+            SpanIndex(*span_arrays),
+            unflatten_positions(symbols),
+            unflatten_positions(gears),
+        )
+
+    def to_bytes(self) -> bytes:
+        spans = self.spans
+        span_arrays = [spans.row_offsets, spans.starts, spans.ends, spans.values]
+        positions = [flatten_positions(self.symbols), flatten_positions(self.gears)]
+        return pack_arrays(type(self).__name__, span_arrays + positions)
+
+    @property
+    def part_numbers(self) -> list[int]:
+        is_part_number = bytearray(len(self.spans))
+        for symbol in self.symbols:
+            for span in self.spans.adjacent_spans(*symbol):
+                is_part_number[span] = 1
         return [
-            processed_string
-            for string in split_line
-            for processed_string in cls.process_string(string)
+            value
+            for value, part_number in zip(self.spans.values, is_part_number)
+            if part_number
         ]
 
-    def process_symbol(
-        self, element: Element, row_index: int, column_index: int
-    ) -> Symbol:
-        gear = element == "*"
-
-        adjacent_indices = [
-            (row_index - 1, column_index - 1),
-            (row_index - 1, column_index),
-            (row_index - 1, column_index + 1),
-            (row_index, column_index - 1),
-            (row_index, column_index + 1),
-            (row_index + 1, column_index - 1),
-            (row_index + 1, column_index),
-            (row_index + 1, column_index + 1),
+    def adjacent_numbers(self, row: int, column: int) -> list[int]:
+        return [
+            self.spans.values[span] for span in self.spans.adjacent_spans(row, column)
         ]
 
-        adjacent_elements = {
-            self.grid[adjacent_row_index][adjacent_column_index]
-            for adjacent_row_index, adjacent_column_index in adjacent_indices
+    @property
+    def gear_ratios(self) -> list[int]:
+        adjacent_numbers = (self.adjacent_numbers(*gear) for gear in self.gears)
+        return [math.prod(numbers) for numbers in adjacent_numbers if len(numbers) == 2]
+
+
+@dataclass
+class SchematicRow:
+    starts: list[int]
+    ends: list[int]
+    values: list[int]
+    symbols: list[int]
+    gears: list[int]
+
+    @classmethod
+    def from_line(cls, line: str) -> Self:
+        row = cls([], [], [], [], [])
+        for element in ELEMENT_PATTERN.finditer(line):
+            if element.group(1):
+                row.starts.append(element.start())
+                row.ends.append(element.end())
+                row.values.append(int(element.group(1)))
+                continue
+            row.symbols.append(element.start())
+            if element.group(2) == "*":
+                row.gears.append(element.start())
+        return row
+
+    def has_symbol(self, start: int, end: int) -> bool:
+        symbol = bisect_left(self.symbols, start - 1)
+        return symbol < len(self.symbols) and self.symbols[symbol] <= end
+
+    def adjacent_numbers(self, column: int) -> list[int]:
+        span = bisect_left(self.ends, column)
+        adjacent_numbers = []
+        while span < len(self.values) and self.starts[span] <= column + 1:
+            adjacent_numbers.append(self.values[span])
+            span += 1
+        return adjacent_numbers
+
+
+def evaluate_window(
+    window: tuple[SchematicRow, SchematicRow, SchematicRow],
+) -> tuple[int, int]:
+    _, middle, _ = window
+    part_number_sum = sum(
+        value
+        for start, end, value in zip(middle.starts, middle.ends, middle.values)
+        if any(row.has_symbol(start, end) for row in window)
+    )
+
+    adjacent_numbers = (
+        [number for row in window for number in row.adjacent_numbers(gear)]
+        for gear in middle.gears
+    )
+    gear_ratio_sum = sum(
+        math.prod(numbers) for numbers in adjacent_numbers if len(numbers) == 2
+    )
+
+    return part_number_sum, gear_ratio_sum
+
+
+def stream_contributions(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
+    empty_row = SchematicRow.from_line("")
+    above, middle = empty_row, None
+
+    for line in lines:
+        below = SchematicRow.from_line(line.rstrip("\r\n"))
+        if middle is not None:
+            yield evaluate_window((above, middle, below))
+            above = middle
+        middle = below
+
+    if middle is not None:
+        yield evaluate_window((above, middle, empty_row))
+
+
+def stream_totals(file: TextIO) -> tuple[int, int]:
+    part_number_total, gear_ratio_total = 0, 0
+    for part_number_sum, gear_ratio_sum in stream_contributions(file):
+        part_number_total += part_number_sum
+        gear_ratio_total += gear_ratio_sum
+    return part_number_total, gear_ratio_total
+
+
+@dataclass
+class Schematic:
+    rows: list[bytearray]
+    part_number_sum: int
+    gear_ratio_sum: int
+
+    @classmethod
+    def from_string(cls, input_data: str) -> Self:
+        grid = Grid.from_string(input_data)
+        rows = [bytearray(line, "ascii") for line in input_data.splitlines()]
+        return cls(rows, sum(grid.part_numbers), sum(grid.gear_ratios))
+
+    def cell(self, row: int, column: int) -> str:
+        if 0 <= row < len(self.rows) and 0 <= column < len(self.rows[row]):
+            return chr(self.rows[row][column])
+        return "."
+
+    def is_symbol(self, row: int, column: int) -> bool:
+        character = self.cell(row, column)
+        return character != "." and not character.isdigit()
+
+    def span_at(self, row: int, column: int) -> Span | None:
+        if not self.cell(row, column).isdigit():
+            return None
+        start, end = column, column + 1
+        while self.cell(row, start - 1).isdigit():
+            start -= 1
+        while self.cell(row, end).isdigit():
+            end += 1
+        return row, start, end
+
+    def spans_near(self, row: int, column: int) -> set[Span]:
+        spans = (
+            self.span_at(adjacent_row, adjacent_column)
+            for adjacent_row in range(row - 1, row + 2)
+            for adjacent_column in range(column - 1, column + 2)
+        )
+        return {span for span in spans if span is not None}
+
+    @staticmethod
+    def span_neighbourhood(span: Span) -> Iterator[Position]:
+        row, start, end = span
+        for adjacent_row in range(row - 1, row + 2):
+            for adjacent_column in range(start - 1, end + 1):
+                yield adjacent_row, adjacent_column
+
+    def span_value(self, span: Span) -> int:
+        row, start, end = span
+        return int(self.rows[row][start:end])
+
+    def part_number_total(self, spans: set[Span]) -> int:
+        return sum(
+            self.span_value(span)
+            for span in spans
+            if any(self.is_symbol(*cell) for cell in self.span_neighbourhood(span))
+        )
+
+    def gear_ratio_total(self, gears: set[Position]) -> int:
+        adjacent_spans = (
+            self.spans_near(*gear) for gear in gears if self.cell(*gear) == "*"
+        )
+        return sum(
+            math.prod(self.span_value(span) for span in spans)
+            for spans in adjacent_spans
+            if len(spans) == 2
+        )
+
+    def set_cell(self, row: int, column: int, character: str) -> None:
+        previous_character = self.rows[row][column]
+        old_spans = self.spans_near(row, column)
+        part_number_delta = -self.part_number_total(old_spans)
+
+        self.rows[row][column] = ord(character)
+        new_spans = self.spans_near(row, column)
+        part_number_delta += self.part_number_total(new_spans)
+
+        gears = {
+            cell
+            for span in old_spans | new_spans
+            for cell in self.span_neighbourhood(span)
         }
+        gears.add((row, column))
+        gear_ratio_delta = self.gear_ratio_total(gears)
 
-        return Symbol(gear, adjacent_elements)
+        self.rows[row][column] = previous_character
+        gear_ratio_delta -= self.gear_ratio_total(gears)
+        self.rows[row][column] = ord(character)
 
-    @property
-    def symbols(self) -> list[Symbol]:
-        return [
-            self.process_symbol(element, row_index, column_index)
-            for row_index, row in enumerate(self.grid)
-            for column_index, element in enumerate(row)
-            if isinstance(element, str)
-        ]
+        self.part_number_sum += part_number_delta
+        self.gear_ratio_sum += gear_ratio_delta
+
+
+def parse(input_data: str) -> Grid:
+    return Grid.from_string(input_data)
+
+
+def solve_part_1(grid: Grid) -> int:
+    return sum(grid.part_numbers)
+
+
+def solve_part_2(grid: Grid) -> int:
+    return sum(grid.gear_ratios)
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    grid = parse(input_data)
+    return solve_part_1(grid), solve_part_2(grid)
 
 
 def part_1_answer(input_data: str) -> int:
-    grid = Grid.from_string(input_data)
-    return sum(symbol.part_number for symbol in grid.symbols)
+    return solve_part_1(parse(input_data))
 
 
 def part_2_answer(input_data: str) -> int:
-    grid = Grid.from_string(input_data)
-    return sum(symbol.gear_ratio for symbol in grid.symbols)
+    return solve_part_2(parse(input_data))
@@ -1,18 +1,72 @@
 """Module for implementing the solution to the problem set on day 4."""
 
-from dataclasses import dataclass
+import re
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Self
+from typing import TYPE_CHECKING, Iterable, Self, TextIO
+
+from src.model_cache import pack_arrays, unpack_arrays
+from src.optional_numpy import np
+
+if TYPE_CHECKING:
+    from src.optional_numpy import IntArray
+
+CARD_INFO_PATTERN = re.compile("Card +[0-9]+:|\\|")
+MATCH_CHUNK_SIZE = 2**16
+
+
+def pack_masks(masks: list[int]) -> tuple["array[int]", "array[int]"]:
+    width = max((max(masks, default=0).bit_length() + 7) // 8, 1)
+    packed = b"".join(mask.to_bytes(width, "little") for mask in masks)
+    return array("I", [width]), array("B", packed)
+
+
+def unpack_masks(width: "array[int]", packed: "array[int]") -> list[int]:
+    data, (mask_width,) = packed.tobytes(), width
+    return [
+        int.from_bytes(data[index : index + mask_width], "little")
+        for index in range(0, len(data), mask_width)
+    ]
+
+
+def calculate_score(num_matches: int) -> int:
+    if num_matches == 0:
+        return 0
+    return 1 << (num_matches - 1)
+
+
+@dataclass
+class CardTally:
+    total_score: int = 0
+    total_cards: int = 0
+    pending_copies: deque[int] = field(default_factory=deque)
+
+    @classmethod
+    def from_match_counts(cls, match_counts: Iterable[int]) -> Self:
+        tally = cls()
+        for num_matches in match_counts:
+            tally.add(num_matches)
+        return tally
+
+    def add(self, num_matches: int) -> None:
+        copies = 1 + (self.pending_copies.popleft() if self.pending_copies else 0)
+        self.total_score += calculate_score(num_matches)
+        self.total_cards += copies
+
+        missing_copies = num_matches - len(self.pending_copies)
+        if missing_copies > 0:
+            self.pending_copies.extend([0] * missing_copies)
+        for index in range(num_matches):
+            self.pending_copies[index] += copies
 
 
 @dataclass
 class Card:
     id: int
-    numbers: list[int]
-    winning_numbers: list[int]
-
-    def __post_init__(self) -> None:
-        self.winning_cards: list[Self] | None = None
+    numbers: int
+    winning_numbers: int
 
     @classmethod
     def from_line(cls, line: str) -> Self:
@@ -25,64 +79,135 @@ class Card:
         return cls(card_id, numbers, winning_numbers)
 
     @staticmethod
-    def process_number_string(numbers: str) -> list[int]:
-        return [int(number) for number in numbers.split(" ") if number]
-
-    @property
-    def matching_numbers(self) -> list[int]:
-        return [number for number in self.numbers if number in self.winning_numbers]
+    def process_number_string(numbers: str) -> int:
+        number_mask = 0
+        for number in numbers.split():
+            number_mask |= 1 << int(number)
+        return number_mask
 
-    @property
+    @cached_property
     def num_matches(self) -> int:
-        return len(self.matching_numbers)
+        return (self.numbers & self.winning_numbers).bit_count()
 
     @property
     def score(self) -> int:
-        if self.num_matches == 0:
-            return 0
-        return 2 ** (self.num_matches - 1)
+        return calculate_score(self.num_matches)
 
-    @property
-    def winning_card_ids(self) -> list[int]:
-        return [self.id + i + 1 for i in range(self.num_matches)]
 
-    def calculate_winning_cards(self, cards: list[Self]) -> None:
-        self.winning_cards = [cards[card_id - 1] for card_id in self.winning_card_ids]
+@dataclass
+class Cards:
+    cards: list[Card]
+
+    @classmethod
+    def from_string(cls, string: str) -> Self:
+        return cls([Card.from_line(line) for line in string.splitlines()])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        ids, *mask_arrays = unpack_arrays(cls.__name__, data)
+        numbers = unpack_masks(*mask_arrays[:2])
+        winning_numbers = unpack_masks(*mask_arrays[2:])
+        return cls(
+            [Card(*card_info) for card_info in zip(ids, numbers, winning_numbers)]
+        )
+
+    def to_bytes(self) -> bytes:
+        ids = array("I", (card.id for card in self.cards))
+        numbers = pack_masks([card.numbers for card in self.cards])
+        winning_numbers = pack_masks([card.winning_numbers for card in self.cards])
+        return pack_arrays(type(self).__name__, [ids, *numbers, *winning_numbers])
+
+    def append(self, card_line: str) -> None:
+        card = Card.from_line(card_line)
+        self.cards.append(card)
+        if "tally" in self.__dict__:
+            self.tally.add(card.num_matches)
 
     @cached_property
-    def num_winning_cards(self) -> int:
-        if self.winning_cards is None:
-            raise ValueError
-        nested_matches = sum(card.num_winning_cards for card in self.winning_cards)
-        return self.num_matches + nested_matches
+    def tally(self) -> CardTally:
+        match_counts = (card.num_matches for card in self.cards)
+        return CardTally.from_match_counts(match_counts)
 
+    @property
+    def total_score(self) -> int:
+        return self.tally.total_score
 
-@dataclass
-class Cards:
-    cards: list[Card]
+    @property
+    def total_cards(self) -> int:
+        return self.tally.total_cards
 
-    def __post_init__(self) -> None:
-        for card in self.cards:
-            card.calculate_winning_cards(self.cards)
+
+@dataclass
+class CardMatrix:
+    numbers: "IntArray"
+    winning_numbers: "IntArray"
 
     @classmethod
     def from_string(cls, string: str) -> Self:
-        return cls([Card.from_line(line) for line in string.splitlines()])
+        first_line, _, _ = string.partition("\n")
+        number_string, winning_number_string = first_line.split(": ")[1].split(" | ")
+        num_numbers = len(number_string.split())
+        row_length = num_numbers + len(winning_number_string.split())
+
+        number_info = CARD_INFO_PATTERN.sub(" ", string)
+        matrix = np.fromstring(number_info, dtype=np.int64, sep=" ")
+        matrix = matrix.reshape(-1, row_length)
+        return cls(matrix[:, :num_numbers], matrix[:, num_numbers:])
+
+    def chunk_match_counts(self, chunk: slice) -> "IntArray":
+        numbers = self.numbers[chunk, :, np.newaxis]
+        winning_numbers = self.winning_numbers[chunk, np.newaxis, :]
+        matches = (numbers == winning_numbers).any(axis=2)
+        return matches.sum(axis=1)  # type: ignore[no-any-return]
+
+    @cached_property
+    def match_counts(self) -> "IntArray":
+        chunks = (
+            slice(start, start + MATCH_CHUNK_SIZE)
+            for start in range(0, len(self.numbers), MATCH_CHUNK_SIZE)
+        )
+        return np.concatenate(
+            [np.zeros(0, dtype=np.int64)]
+            + [self.chunk_match_counts(chunk) for chunk in chunks]
+        )
 
     @property
     def total_score(self) -> int:
-        return sum(card.score for card in self.cards)
+        match_counts = self.match_counts
+        scores = np.where(match_counts > 0, 1 << np.maximum(match_counts - 1, 0), 0)
+        return int(np.sum(scores))
 
     @property
     def total_cards(self) -> int:
-        return sum(1 + card.num_winning_cards for card in self.cards)
+        return CardTally.from_match_counts(self.match_counts.tolist()).total_cards
 
 
-def part_1_answer(input_data: str) -> int:
-    cards = Cards.from_string(input_data)
+def stream_totals(file: TextIO) -> tuple[int, int]:
+    match_counts = (Card.from_line(line).num_matches for line in file if line.strip())
+    tally = CardTally.from_match_counts(match_counts)
+    return tally.total_score, tally.total_cards
+
+
+def parse(input_data: str) -> Cards:
+    return Cards.from_string(input_data)
+
+
+def solve_part_1(cards: Cards) -> int:
     return cards.total_score
 
 
-def part_2_answer(input_data: str) -> int:
-    cards = Cards.from_string(input_data)
+def solve_part_2(cards: Cards) -> int:
     return cards.total_cards
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    cards = parse(input_data)
+    return solve_part_1(cards), solve_part_2(cards)
+
+
+def part_1_answer(input_data: str) -> int:
+    return solve_part_1(parse(input_data))
+
+
+def part_2_answer(input_data: str) -> int:
+    return solve_part_2(parse(input_data))
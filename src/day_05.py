@@ -1,8 +1,32 @@
 """Module for implementing the solution to the problem set on day 5."""
 
-from dataclasses import dataclass
-from functools import partial
-from typing import Self
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import chain
+from typing import TYPE_CHECKING, Iterator, Self, TextIO
+
+from src.model_cache import pack_arrays, unpack_arrays
+from src.optional_numpy import np
+
+if TYPE_CHECKING:
+    from src.optional_numpy import IntArray
+
+Interval = tuple[int, int]
+
+INT64_LIMIT = 2**62
+SEED_CHUNK_SIZE = 2**16
+
+
+def merge_intervals(intervals: list[Interval]) -> list[Interval]:
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
 
 @dataclass
@@ -19,46 +43,184 @@ class Range:
         offset = int(destination_start) - start
         return cls(start, end, offset)
 
-    def inverse(self) -> Self:
-        destination_start = self.start + self.offset
-        destination_end = self.end + self.offset
-        return self.__class__(destination_start, destination_end, -self.offset)
-
 
 @dataclass
 class Mapping:
     ranges: list[Range]
 
+    def __post_init__(self) -> None:
+        self.ranges.sort(key=lambda mapping_range: mapping_range.start)
+        self.range_ends = [mapping_range.end for mapping_range in self.ranges]
+
     @classmethod
     def from_strings(cls, range_strings: list[str]) -> Self:
         return cls([Range.from_string(range_string) for range_string in range_strings])
 
-    def map_number(self, input_number: int) -> int:
-        for mapping_range in self.ranges:
-            if mapping_range.start <= input_number <= mapping_range.end:
-                return input_number + mapping_range.offset
-        return input_number
+    def split_interval(self, interval: Interval) -> list[Interval]:
+        start, end = interval
+        split_intervals = []
+        index = bisect_right(self.range_ends, start - 1)
+
+        for mapping_range in self.ranges[index:]:
+            if start > end or mapping_range.start > end:
+                break
+            if start < mapping_range.start:
+                split_intervals.append((start, mapping_range.start - 1))
+                start = mapping_range.start
+            split_end = min(end, mapping_range.end)
+            offset = mapping_range.offset
+            split_intervals.append((start + offset, split_end + offset))
+            start = split_end + 1
 
-    def inverse(self) -> Self:
-        inverse_ranges = [mapping_range.inverse() for mapping_range in self.ranges]
-        return self.__class__(inverse_ranges)
+        if start <= end:
+            split_intervals.append((start, end))
+
+        return split_intervals
+
+    def map_intervals(self, intervals: list[Interval]) -> list[Interval]:
+        return merge_intervals(
+            [
+                split_interval
+                for interval in intervals
+                for split_interval in self.split_interval(interval)
+            ]
+        )
+
+    @cached_property
+    def range_arrays(self) -> tuple["IntArray", "IntArray", "IntArray"]:
+        starts, ends, offsets = zip(
+            *(
+                (mapping_range.start, mapping_range.end, mapping_range.offset)
+                for mapping_range in self.ranges
+            )
+        )
+        return (
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+            np.array(offsets, dtype=np.int64),
+        )
+
+    def map_array(self, numbers: "IntArray") -> "IntArray":
+        if not self.ranges:
+            return numbers
+        starts, ends, offsets = self.range_arrays
+        indices = np.searchsorted(starts, numbers, side="right") - 1
+        clipped_indices = np.maximum(indices, 0)
+        in_range = (indices >= 0) & (numbers <= ends[clipped_indices])
+        return numbers + np.where(in_range, offsets[clipped_indices], 0)
 
     @property
-    def critical_points(self) -> list[int]:
+    def bounds(self) -> list[int]:
         return [
-            critical_point
+            bound
             for mapping_range in self.ranges
-            for critical_point in (mapping_range.start, mapping_range.end)
+            for bound in (mapping_range.end, mapping_range.end + mapping_range.offset)
         ]
 
+    @property
+    def segments(self) -> tuple[list[int], list[int]]:
+        starts, offsets = [0], [0]
+        for mapping_range in self.ranges:
+            if mapping_range.start > starts[-1]:
+                starts.append(mapping_range.start)
+                offsets.append(mapping_range.offset)
+            else:
+                offsets[-1] = mapping_range.offset
+            starts.append(mapping_range.end + 1)
+            offsets.append(0)
+        return starts, offsets
+
+
+@dataclass
+class ComposedMapping:
+    starts: list[int]
+    offsets: list[int]
+
+    def __post_init__(self) -> None:
+        self.merge_segments()
+
+    @classmethod
+    def from_mappings(cls, mappings: list[Mapping]) -> Self:
+        starts, offsets = [0], [0]
+        for mapping in mappings:
+            starts, offsets = cls.compose(starts, offsets, *mapping.segments)
+        return cls(starts, offsets)
+
+    @staticmethod
+    def compose(
+        starts: list[int],
+        offsets: list[int],
+        next_starts: list[int],
+        next_offsets: list[int],
+    ) -> tuple[list[int], list[int]]:
+        composed_starts, composed_offsets = [], []
+        segment_ends: list[int | None] = [*starts[1:], None]
+
+        for start, end, offset in zip(starts, segment_ends, offsets):
+            index = bisect_right(next_starts, start + offset) - 1
+            composed_starts.append(start)
+            composed_offsets.append(offset + next_offsets[index])
+
+            for index in range(index + 1, len(next_starts)):
+                next_start = next_starts[index] - offset
+                if end is not None and next_start >= end:
+                    break
+                composed_starts.append(next_start)
+                composed_offsets.append(offset + next_offsets[index])
+
+        return composed_starts, composed_offsets
+
+    def merge_segments(self) -> None:
+        starts, offsets = self.starts[:1], self.offsets[:1]
+        for start, offset in zip(self.starts[1:], self.offsets[1:]):
+            if offset != offsets[-1]:
+                starts.append(start)
+                offsets.append(offset)
+        self.starts, self.offsets = starts, offsets
+
+    def map_number(self, input_number: int) -> int:
+        if input_number < 0:
+            raise ValueError(f"cannot map negative number {input_number}")
+        return input_number + self.offsets[bisect_right(self.starts, input_number) - 1]
+
+    def map_many(self, sorted_numbers: list[int]) -> list[int]:
+        if sorted_numbers and sorted_numbers[0] < 0:
+            raise ValueError(f"cannot map negative number {sorted_numbers[0]}")
+        mapped_numbers = []
+        index = 0
+        next_start = self.starts[1] if len(self.starts) > 1 else None
+
+        for number in sorted_numbers:
+            if next_start is not None and number >= next_start:
+                index = bisect_right(self.starts, number, index) - 1
+                next_start = (
+                    self.starts[index + 1] if index + 1 < len(self.starts) else None
+                )
+            mapped_numbers.append(number + self.offsets[index])
+
+        return mapped_numbers
+
+    def min_over(self, interval: Interval) -> int:
+        start, end = interval
+        index = bisect_right(self.starts, start) - 1
+        minimum = start + self.offsets[index]
+
+        for index in range(index + 1, len(self.starts)):
+            if self.starts[index] > end:
+                break
+            minimum = min(minimum, self.starts[index] + self.offsets[index])
+
+        return minimum
+
 
 @dataclass
 class Almanac:
     mappings: list[Mapping]
     seeds: list[int]
+    seed_ranges: list[Interval] = field(default_factory=list)
 
     @classmethod
-    def from_string(cls, input_data: str, seed_range: bool = False) -> Self:
+    def from_string(cls, input_data: str) -> Self:
         seeds_string, *mappings_strings = input_data.split("\n\n")
         mapping_range_strings = (
             mapping_strings.splitlines()[1:] for mapping_strings in mappings_strings
@@ -68,69 +230,157 @@ class Almanac:
             Mapping.from_strings(range_strings)
             for range_strings in mapping_range_strings
         ]
-        seeds = cls.process_seeds(mappings, seeds_string, seed_range)
-        return cls(mappings, seeds)
+        seeds = cls.process_seeds(seeds_string)
+        return cls(mappings, seeds, cls.process_seed_ranges(seeds))
 
     @classmethod
-    def process_seeds(
-        cls, mappings: list[Mapping], seeds_string: str, seed_range: bool
-    ) -> list[int]:
-        seeds = [int(seed) for seed in seeds_string.split(" ")[1:]]
+    def from_bytes(cls, data: bytes) -> Self:
+        range_offsets, *range_columns, seeds, seed_ranges = unpack_arrays(
+            cls.__name__, data
+        )
+        ranges = list(map(Range, *range_columns))
+        mappings = [
+            Mapping(ranges[low:high])
+            for low, high in zip(range_offsets, range_offsets[1:])
+        ]
+        seed_intervals = list(zip(seed_ranges[::2], seed_ranges[1::2]))
+        return cls(mappings, seeds.tolist(), seed_intervals)
+
+    def to_bytes(self) -> bytes:
+        ranges = [
+            mapping_range
+            for mapping in self.mappings
+            for mapping_range in mapping.ranges
+        ]
+        range_offsets = array("Q", [0])
+        for mapping in self.mappings:
+            range_offsets.append(range_offsets[-1] + len(mapping.ranges))
+        arrays = [
+            range_offsets,
+            array("q", (mapping_range.start for mapping_range in ranges)),
+            array("q", (mapping_range.end for mapping_range in ranges)),
+            array("q", (mapping_range.offset for mapping_range in ranges)),
+            array("q", self.seeds),
+            array("q", chain.from_iterable(self.seed_ranges)),
+        ]
+        return pack_arrays(type(self).__name__, arrays)
+
+    @staticmethod
+    def mappings_from_file(file: TextIO) -> list[Mapping]:
+        file.seek(0)
+        while (line := file.readline(SEED_CHUNK_SIZE)) and not line.endswith("\n"):
+            pass
+
+        range_strings: list[list[str]] = []
+        for line in file:
+            line = line.strip()
+            if line.endswith("map:"):
+                range_strings.append([])
+            elif line:
+                range_strings[-1].append(line)
+
+        return [Mapping.from_strings(strings) for strings in range_strings]
+
+    @staticmethod
+    def stream_seeds(file: TextIO) -> Iterator[int]:
+        file.seek(0)
+        remainder = ""
+
+        while line := file.readline(SEED_CHUNK_SIZE):
+            *seed_strings, remainder = (remainder + line.rstrip("\n")).split(" ")
+            yield from (int(seed) for seed in seed_strings if seed.isdigit())
+            if line.endswith("\n"):
+                break
+
+        if remainder.isdigit():
+            yield int(remainder)
+
+    @classmethod
+    def stream_closest_location(cls, file: TextIO, seed_range: bool = False) -> int:
+        composed_mapping = ComposedMapping.from_mappings(cls.mappings_from_file(file))
+        seeds = cls.stream_seeds(file)
 
         if not seed_range:
-            return seeds
+            return min(composed_mapping.map_number(seed) for seed in seeds)
 
+        return min(
+            composed_mapping.min_over((start, start + seed_range - 1))
+            for start, seed_range in zip(seeds, seeds)
+            if seed_range > 0
+        )
+
+    @staticmethod
+    def process_seeds(seeds_string: str) -> list[int]:
+        return [int(seed) for seed in seeds_string.split(" ")[1:]]
+
+    @staticmethod
+    def process_seed_ranges(seeds: list[int]) -> list[Interval]:
         seed_ranges = [
             (start, start + seed_range - 1)
             for start, seed_range in zip(seeds[::2], seeds[1::2])
         ]
+        return merge_intervals(seed_ranges)
 
-        inverse_mappings = [mapping.inverse() for mapping in reversed(mappings)]
-        _map_back_to_seed = partial(cls.map_back_to_seed, inverse_mappings)
-
-        critical_mapping_points = [
-            _map_back_to_seed(critical_point, mapping_layer)
-            for mapping_layer, mapping in enumerate(mappings)
-            for critical_point in mapping.critical_points
-        ]
-
-        critical_points = seeds + critical_mapping_points
+    @cached_property
+    def composed_mapping(self) -> ComposedMapping:
+        return ComposedMapping.from_mappings(self.mappings)
 
-        seeds = [
-            seed
-            for seed in critical_points
-            for seed_start, seed_end in seed_ranges
-            if seed_start <= seed <= seed_end
+    @property
+    def fits_int64(self) -> bool:
+        bounds = [
+            *self.seeds,
+            *(bound for mapping in self.mappings for bound in mapping.bounds),
         ]
+        return max(bounds, default=0) < INT64_LIMIT
 
+    def map_seed_array(self, seeds: "IntArray") -> "IntArray":
+        for mapping in self.mappings:
+            seeds = mapping.map_array(seeds)
         return seeds
 
-    @staticmethod
-    def map_seed_to_location(mappings: list[Mapping], seed: int) -> int:
-        for mapping in mappings:
-            seed = mapping.map_number(seed)
-        return seed
-
-    @classmethod
-    def map_back_to_seed(
-        cls, inverse_mappings: list[Mapping], seed: int, mapping_layer: int
-    ) -> int:
-        return cls.map_seed_to_location(inverse_mappings[-mapping_layer:], seed)
-
     @property
     def critical_locations(self) -> list[int]:
-        return [self.map_seed_to_location(self.mappings, seed) for seed in self.seeds]
+        if np is not None and self.fits_int64:
+            seeds = np.sort(np.array(self.seeds, dtype=np.int64))
+            return self.map_seed_array(seeds).tolist()  # type: ignore[no-any-return]
+        return self.composed_mapping.map_many(sorted(self.seeds))
+
+    @property
+    def location_ranges(self) -> list[Interval]:
+        intervals = self.seed_ranges
+        for mapping in self.mappings:
+            intervals = mapping.map_intervals(intervals)
+        return intervals
 
     @property
     def closest_location(self) -> int:
         return min(self.critical_locations)
 
+    @property
+    def closest_range_location(self) -> int:
+        return self.location_ranges[0][0]
 
-def part_1_answer(input_data: str) -> int:
-    almanac = Almanac.from_string(input_data)
+
+def parse(input_data: str) -> Almanac:
+    return Almanac.from_string(input_data)
+
+
+def solve_part_1(almanac: Almanac) -> int:
     return almanac.closest_location
 
 
+def solve_part_2(almanac: Almanac) -> int:
+    return almanac.closest_range_location
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    almanac = parse(input_data)
+    return solve_part_1(almanac), solve_part_2(almanac)
+
+
+def part_1_answer(input_data: str) -> int:
+    return solve_part_1(parse(input_data))
+
+
 def part_2_answer(input_data: str) -> int:
-    almanac = Almanac.from_string(input_data, seed_range=True)
-    return almanac.closest_location
+    return solve_part_2(parse(input_data))
@@ -2,6 +2,15 @@
 
 import math
 import re
+from typing import TYPE_CHECKING, Sequence
+
+from src.optional_numpy import np
+
+if TYPE_CHECKING:
+    from src.optional_numpy import IntArray
+
+INT64_TIME_LIMIT = 2**31
+INT64_DISTANCE_LIMIT = 2**60
 
 
 def process_digits(digits: list[str], combine_digits: bool) -> list[int]:
@@ -11,22 +20,94 @@ def process_digits(digits: list[str], combine_digits: bool) -> list[int]:
 
 
 def winning_races(time: int, distance: int) -> int:
-    discriminant = math.sqrt(time**2 - 4 * distance)
-    least_time = math.floor((time - discriminant) / 2 + 1)
-    most_time = math.ceil((time + discriminant) / 2 - 1)
-    return most_time - least_time + 1
+    discriminant = time**2 - 4 * distance
+    if discriminant <= 0:
+        return 0
+
+    least_time = max((time - math.isqrt(discriminant)) // 2 - 1, 0)
+    while least_time <= time // 2 and least_time * (time - least_time) <= distance:
+        least_time += 1
+    return max(time - 2 * least_time + 1, 0)
+
+
+def winning_races_array(times: "IntArray", distances: "IntArray") -> "IntArray":
+    discriminants = times * times - 4 * distances
+    roots = np.sqrt(np.maximum(discriminants, 0).astype(np.float64))
+    least_times = np.maximum(((times - roots) // 2).astype(np.int64) - 1, 0)
+
+    while True:
+        losing = (least_times <= times // 2) & (
+            least_times * (times - least_times) <= distances
+        )
+        if not losing.any():
+            break
+        least_times += losing
+
+    races_won: "IntArray" = np.maximum(times - 2 * least_times + 1, 0)
+    races_won[discriminants <= 0] = 0
+    return races_won
+
+
+def fits_int64(times: Sequence[int], distances: Sequence[int]) -> bool:
+    return (
+        max(times, default=0) < INT64_TIME_LIMIT
+        and max(distances, default=0) < INT64_DISTANCE_LIMIT
+        and min(times, default=0) >= 0
+        and min(distances, default=0) >= 0
+    )
+
+
+def balanced_product(numbers: list[int]) -> int:
+    if 0 in numbers:
+        return 0
+    while len(numbers) > 1:
+        numbers = [
+            math.prod(numbers[index : index + 2]) for index in range(0, len(numbers), 2)
+        ]
+    return numbers[0] if numbers else 1
+
+
+def batch_winning_races(
+    times: Sequence[int], distances: Sequence[int]
+) -> tuple[list[int], int]:
+    if np is not None and fits_int64(times, distances):
+        races_array = winning_races_array(
+            np.asarray(times, dtype=np.int64), np.asarray(distances, dtype=np.int64)
+        )
+        races_won: list[int] = races_array.tolist()
+    else:
+        races_won = [
+            winning_races(*race_params) for race_params in zip(times, distances)
+        ]
+    return races_won, balanced_product(races_won)
+
+
+def total_winning_races(digits: list[list[str]], combine_digits: bool = False) -> int:
+    times, distances = [process_digits(digit, combine_digits) for digit in digits]
+    _, races_won_product = batch_winning_races(times, distances)
+    return races_won_product
+
+
+def parse(input_data: str) -> list[list[str]]:
+    return [re.findall("[0-9]+", line) for line in input_data.splitlines()]
+
+
+def solve_part_1(digits: list[list[str]]) -> int:
+    return total_winning_races(digits)
+
+
+def solve_part_2(digits: list[list[str]]) -> int:
+    return total_winning_races(digits, combine_digits=True)
 
 
-def total_winning_races(input_data: str, combine_digits: bool = False) -> int:
-    digits = [re.findall("[0-9]+", line) for line in input_data.splitlines()]
-    processed_digits = [process_digits(digit, combine_digits) for digit in digits]
-    races_won = [winning_races(*race_params) for race_params in zip(*processed_digits)]
-    return math.prod(races_won)
+def solve(input_data: str) -> tuple[int, int]:
+    digits = parse(input_data)
+    return solve_part_1(digits), solve_part_2(digits)
 
 
 def part_1_answer(input_data: str) -> int:
-    return total_winning_races(input_data)
+    return solve_part_1(parse(input_data))
 
 
 def part_2_answer(input_data: str) -> int:
-    return total_winning_races(input_data, combine_digits=True)
+    return solve_part_2(parse(input_data))
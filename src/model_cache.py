@@ -0,0 +1,211 @@
+"""Module for caching parsed models on disk in a compact binary form."""
+
+import hashlib
+import os
+import struct
+from array import array
+from dataclasses import is_dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, get_type_hints
+
+from src.answer_cache import evict, source_digest
+
+MODEL_DIRECTORY = Path(".aoc_cache", "models")
+MAX_MODELS = 64
+ENABLE_VARIABLE = "AOC_MODEL_CACHE"
+
+MAGIC = b"AOCM\x01"
+HEADER_FORMAT = "<BI"
+ARRAY_FORMAT = "<cBQ"
+
+
+def model_cache_enabled() -> bool:
+    """Checks if the model cache is enabled, which it is only when the enable
+    environment variable is set to a non-empty value.
+
+    The cache is opt in as the models of large inputs take up space on disk.
+
+    Returns
+    -------
+    bool: True if the model cache is enabled, False if not.
+    """
+    return bool(os.environ.get(ENABLE_VARIABLE))
+
+
+def pack_arrays(kind: str, arrays: list["array[int]"]) -> bytes:
+    """Packs arrays into bytes, with a header naming the kind of model and the
+    typecode, item size and length of every array.
+
+    Parameters
+    ----------
+    kind: str
+        The kind of model the arrays describe.
+
+    arrays: list[array[int]]
+        The arrays to pack.
+
+    Returns
+    -------
+    bytes: The packed arrays.
+    """
+    kind_bytes = kind.encode()
+    chunks = [MAGIC, struct.pack(HEADER_FORMAT, len(kind_bytes), len(arrays))]
+    chunks.append(kind_bytes)
+    for values in arrays:
+        typecode = values.typecode.encode()
+        chunks.append(struct.pack(ARRAY_FORMAT, typecode, values.itemsize, len(values)))
+    chunks.extend(values.tobytes() for values in arrays)
+    return b"".join(chunks)
+
+
+def unpack_arrays(kind: str, data: bytes) -> list["array[int]"]:
+    """Unpacks arrays packed by pack_arrays.
+
+    Parameters
+    ----------
+    kind: str
+        The kind of model the arrays are expected to describe.
+
+    data: bytes
+        The packed arrays.
+
+    Returns
+    -------
+    list[array[int]]: The unpacked arrays.
+
+    Raises
+    ------
+    ValueError: If the data is not packed arrays of that kind of model, or was
+    packed on a platform with different item sizes.
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("data is not packed arrays")
+    position = len(MAGIC)
+    kind_length, num_arrays = struct.unpack_from(HEADER_FORMAT, data, position)
+    position += struct.calcsize(HEADER_FORMAT)
+    if data[position : position + kind_length] != kind.encode():
+        raise ValueError(f"data is not packed arrays of a {kind}")
+    position += kind_length
+
+    headers = []
+    for _ in range(num_arrays):
+        headers.append(struct.unpack_from(ARRAY_FORMAT, data, position))
+        position += struct.calcsize(ARRAY_FORMAT)
+
+    arrays = []
+    for typecode, itemsize, length in headers:
+        values = array(typecode.decode())
+        if values.itemsize != itemsize:
+            raise ValueError(f"array item size {itemsize} does not match")
+        end = position + itemsize * length
+        values.frombytes(data[position:end])
+        arrays.append(values)
+        position = end
+
+    if position != len(data):
+        raise ValueError("data has trailing bytes")
+    return arrays
+
+
+def model_path(
+    module: ModuleType, input_data: str, directory: Path = MODEL_DIRECTORY
+) -> Path:
+    """The file path of the cached model of the input data, which changes
+    whenever the source digest of the solution or the input data changes, so
+    that a model is never loaded by a different parser than the one that
+    stored it.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    input_data: str
+        The input data of the model.
+
+    directory: Path
+        The directory of the cache.
+
+    Returns
+    -------
+    Path: The file path, named after the day and the SHA-256 of the source
+    digest and input.
+    """
+    day = module.__name__.rpartition(".")[2]
+    digest = hashlib.sha256(source_digest(module).encode())
+    digest.update(input_data.encode())
+    return directory / f"{day}-{digest.hexdigest()}.bin"
+
+
+def load_or_parse(
+    module: ModuleType, input_data: str, directory: Path = MODEL_DIRECTORY
+) -> Any:
+    """Loads in the parsed model of the input data from the cache, parsing and
+    storing it if it is not cached.
+
+    Only models with to_bytes and from_bytes methods are cached, and models
+    whose values do not fit in their packed arrays are parsed every time.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the parse function of the problem.
+
+    input_data: str
+        The input data to parse.
+
+    directory: Path
+        The directory of the cache.
+
+    Returns
+    -------
+    Any: The parsed model.
+    """
+    model_class = get_type_hints(module.parse)["return"]
+    if not (is_dataclass(model_class) and hasattr(model_class, "from_bytes")):
+        return module.parse(input_data)
+
+    path = model_path(module, input_data, directory)
+    try:
+        model = model_class.from_bytes(path.read_bytes())
+        os.utime(path)
+        return model
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
+
+    model = module.parse(input_data)
+    try:
+        data = model.to_bytes()
+    except OverflowError:
+        return model
+
+    directory.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary_path.write_bytes(data)
+    os.replace(temporary_path, path)
+    evict(directory, MAX_MODELS, "*.bin")
+    return model
+
+
+def parse_input(module: ModuleType, input_data: str, use_model_cache: bool) -> Any:
+    """Parses the input data of a day into its model.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the parse function of the problem.
+
+    input_data: str
+        The input data to parse.
+
+    use_model_cache: bool
+        Whether to load the parsed model from the model cache on disk.
+
+    Returns
+    -------
+    Any: The parsed model.
+    """
+    if use_model_cache:
+        return load_or_parse(module, input_data)
+    return module.parse(input_data)
@@ -0,0 +1,16 @@
+"""Module for importing NumPy, which is an optional dependency."""
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    ByteArray = NDArray[np.uint8]
+    IntArray = NDArray[np.int64]
+
+__all__ = ["np", "ByteArray", "IntArray"]
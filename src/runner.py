@@ -0,0 +1,481 @@
+"""Module for running the solutions to every day in parallel and reporting timings."""
+
+import argparse
+import importlib
+import json
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from src.answer_cache import cache_enabled, cache_key, load_answers, store_answers
+from src.data_loader import load_text
+from src.model_cache import model_cache_enabled, parse_input
+
+SOURCE_DIRECTORY = Path(__file__).parent
+PARTS = (1, 2)
+
+Task = tuple[str, int]
+
+
+def discover_days() -> list[str]:
+    """Discovers the days that have a solution module.
+
+    Returns
+    -------
+    list[str]: The names of the day modules, such as "day_01", in order.
+    """
+    return sorted(path.stem for path in SOURCE_DIRECTORY.glob("day_*.py"))
+
+
+def load_input(data_directory: str, day: str, part: int) -> str:
+    """Loads in the input data for a part of the problem through the shared
+    cache.
+
+    Parameters
+    ----------
+    data_directory: str
+        The directory containing the data for every day.
+
+    day: str
+        The day of the problem.
+
+    part: int
+        The part of the problem.
+
+    Returns
+    -------
+    str: The part specific input if it exists, otherwise the shared input.
+    """
+    part_input = load_text(Path(data_directory, day, f"part_{part}_input.txt"))
+    if part_input is not None:
+        return part_input
+
+    input_path = Path(data_directory, day, "input.txt")
+    input_data = load_text(input_path)
+    if input_data is None:
+        raise FileNotFoundError(input_path)
+    return input_data
+
+
+def measure(
+    function: Callable[..., Any], *arguments: Any
+) -> tuple[Any, dict[str, Any]]:
+    """Calls a function and measures the resources it uses.
+
+    Parameters
+    ----------
+    function: Callable[..., Any]
+        The function to call.
+
+    *arguments: Any
+        The arguments passed to the function.
+
+    Returns
+    -------
+    tuple[Any, dict[str, Any]]: The value returned by the function, and its
+    wall time, CPU time and the peak resident set size in kilobytes of the
+    process so far.
+    """
+    start_wall_time, start_cpu_time = time.perf_counter(), time.process_time()
+    value = function(*arguments)
+    timings = {
+        "wall_time": time.perf_counter() - start_wall_time,
+        "cpu_time": time.process_time() - start_cpu_time,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    return value, timings
+
+
+def load_cached_answer(
+    module: ModuleType, part: int, input_data: str, use_cache: bool
+) -> list[Any] | None:
+    """Loads in the answer to a part from the answer cache on disk.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    part: int
+        The part of the problem.
+
+    input_data: str
+        The input data of the part.
+
+    use_cache: bool
+        Whether to use the answer cache.
+
+    Returns
+    -------
+    list[Any] | None: The cached answer, or None if it is not cached or the
+    cache is not used.
+    """
+    if not (use_cache and cache_enabled()):
+        return None
+    return load_answers(cache_key(module, (part,), input_data))
+
+
+def store_cached_answer(
+    module: ModuleType, part: int, input_data: str, answers: list[Any], use_cache: bool
+) -> None:
+    """Stores the answer to a part in the answer cache on disk.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    part: int
+        The part of the problem.
+
+    input_data: str
+        The input data of the part.
+
+    answers: list[Any]
+        The answer to the part.
+
+    use_cache: bool
+        Whether to use the answer cache.
+
+    Returns
+    -------
+    None
+    """
+    if use_cache and cache_enabled():
+        store_answers(cache_key(module, (part,), input_data), answers)
+
+
+def error_result(phase: str, part: int, error: Exception) -> dict[str, Any]:
+    """The result of a phase of a part that raised an exception.
+
+    Parameters
+    ----------
+    phase: str
+        The phase that raised the exception.
+
+    part: int
+        The part of the problem.
+
+    error: Exception
+        The exception raised by the phase.
+
+    Returns
+    -------
+    dict[str, Any]: The result, with the phase, the part and the error.
+    """
+    return {"phase": phase, "part": part, "error": f"{type(error).__name__}: {error}"}
+
+
+def solve_phases(
+    module: ModuleType, part: int, input_data: str, use_model_cache: bool = False
+) -> list[dict[str, Any]]:
+    """Solves a part of a day and measures the resources each phase uses.
+
+    The input is parsed into a model and the parse and the solve are measured
+    separately. Modules without a parse function have a single solve phase.
+    A phase that raises an exception ends the part with an error result.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    part: int
+        The part to solve.
+
+    input_data: str
+        The input data of the part.
+
+    use_model_cache: bool
+        Whether to load the parsed model from the model cache on disk.
+
+    Returns
+    -------
+    list[dict[str, Any]]: The results of the phases, each with the phase, the
+    part and its timings, where the solve phase also has the answer. The
+    phase that raised an exception has the error instead.
+    """
+    results: list[dict[str, Any]] = []
+    phase = "solve"
+
+    try:
+        if not hasattr(module, "parse"):
+            part_answer = getattr(module, f"part_{part}_answer")
+            answer, timings = measure(part_answer, input_data)
+        else:
+            phase = "parse"
+            model, timings = measure(parse_input, module, input_data, use_model_cache)
+            results.append({"phase": phase, "part": part} | timings)
+            phase = "solve"
+            solve_part = getattr(module, f"solve_part_{part}")
+            answer, timings = measure(solve_part, model)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        results.append(error_result(phase, part, error))
+        return results
+
+    result = {"phase": "solve", "part": part, "answers": [answer]}
+    results.append(result | {"cached": False} | timings)
+    return results
+
+
+def run_task(
+    task: Task,
+    data_directory: str,
+    use_cache: bool = True,
+    use_model_cache: bool = False,
+) -> list[dict[str, Any]]:
+    """Runs a part of a day and measures the resources each phase uses.
+
+    The answer is loaded from the answer cache if it is in it, and otherwise
+    the part is solved with its parse and solve phases reported separately.
+    The peak resident set size is that of the worker process so far, so as
+    each part runs in a fresh worker it covers the phases of that part alone.
+    An exception raised while loading the part is reported as an error result
+    of its solve phase.
+
+    Parameters
+    ----------
+    task: Task
+        The day of the problem and the part to run.
+
+    data_directory: str
+        The directory containing the data for every day.
+
+    use_cache: bool
+        Whether to load the answer from the answer cache on disk.
+
+    use_model_cache: bool
+        Whether to load the parsed model from the model cache on disk.
+
+    Returns
+    -------
+    list[dict[str, Any]]: The results of the phases, each with the day, the
+    phase, the part and its timings, where the solve phase also has the
+    answer and whether it was cached, or the error of the phase that failed.
+    """
+    day, part = task
+    try:
+        module = importlib.import_module(f"src.{day}")
+        input_data = load_input(data_directory, day, part)
+        answers, timings = measure(
+            load_cached_answer, module, part, input_data, use_cache
+        )
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return [{"day": day} | error_result("solve", part, error)]
+
+    if answers is not None:
+        return [
+            {"day": day, "phase": "solve", "part": part, "answers": answers}
+            | {"cached": True}
+            | timings
+        ]
+
+    results = solve_phases(module, part, input_data, use_model_cache)
+    if "answers" in results[-1]:
+        store_cached_answer(module, part, input_data, results[-1]["answers"], use_cache)
+    return [{"day": day} | result for result in results]
+
+
+def load_history(history_path: str) -> dict[str, float]:
+    """Loads in the wall times of the previous run of each day.
+
+    Parameters
+    ----------
+    history_path: str
+        The file path of the timing history.
+
+    Returns
+    -------
+    dict[str, float]: The previous wall time keyed by day.
+    """
+    if not os.path.isfile(history_path):
+        return {}
+    with open(history_path, encoding="utf-8") as f:
+        history: dict[str, float] = json.load(f)
+    return history
+
+
+def save_history(history_path: str, results: list[dict[str, Any]]) -> None:
+    """Saves the total wall time of the phases of each day to the timing
+    history, skipping days whose answers were all cached as their times do
+    not reflect the solution.
+
+    Parameters
+    ----------
+    history_path: str
+        The file path of the timing history.
+
+    results: list[dict[str, Any]]
+        The results of the phases.
+
+    Returns
+    -------
+    None
+    """
+    history = load_history(history_path)
+    solved_days = {
+        result["day"] for result in results if not result.get("cached", False)
+    }
+    for day in solved_days:
+        history[day] = sum(
+            result.get("wall_time", 0.0) for result in results if result["day"] == day
+        )
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+
+
+def create_tasks(days: list[str], history: dict[str, float]) -> list[Task]:
+    """Creates a task for each part of the days, ordered with the parts of the
+    historically slowest days first so that they do not hold up the end of the
+    run.
+
+    Parameters
+    ----------
+    days: list[str]
+        The days of the problems to run.
+
+    history: dict[str, float]
+        The previous wall time keyed by day.
+
+    Returns
+    -------
+    list[Task]: The tasks, where tasks without a history come first.
+    """
+    tasks = [(day, part) for day in days for part in PARTS]
+    return sorted(
+        tasks, key=lambda task: history.get(task[0], float("inf")), reverse=True
+    )
+
+
+def run_tasks(
+    tasks: list[Task],
+    data_directory: str,
+    max_workers: int | None,
+    use_cache: bool = True,
+    use_model_cache: bool = False,
+) -> list[dict[str, Any]]:
+    """Runs the tasks in separate processes.
+
+    Each worker process runs a single task so that the peak resident set size
+    is measured for that part alone, with the part parsing its own input. A
+    task whose worker fails, such as by running out of memory, is reported as
+    an error result so that the other tasks are still reported.
+
+    Parameters
+    ----------
+    tasks: list[Task]
+        The tasks to run, in the order they are submitted.
+
+    data_directory: str
+        The directory containing the data for every day.
+
+    max_workers: int | None
+        The maximum number of worker processes, or None for the CPU count.
+
+    use_cache: bool
+        Whether to load the answers from the answer cache on disk.
+
+    use_model_cache: bool
+        Whether to load the parsed models from the model cache on disk.
+
+    Returns
+    -------
+    list[dict[str, Any]]: The results of the phases of every task, ordered by
+    day and part with the parse phase before the solve phase.
+    """
+    with ProcessPoolExecutor(max_workers, max_tasks_per_child=1) as executor:
+        futures = [
+            executor.submit(run_task, task, data_directory, use_cache, use_model_cache)
+            for task in tasks
+        ]
+        results = []
+        for (day, part), future in zip(tasks, futures):
+            try:
+                results.extend(future.result())
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results.append({"day": day} | error_result("solve", part, error))
+    return sorted(
+        results,
+        key=lambda result: (
+            result["day"],
+            result["part"],
+            result["phase"] == "solve",
+        ),
+    )
+
+
+def parse_arguments(argv: list[str] | None) -> argparse.Namespace:
+    """Parses the command line arguments of the runner.
+
+    Parameters
+    ----------
+    argv: list[str] | None
+        The command line arguments, or None to use sys.argv.
+
+    Returns
+    -------
+    argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="aoc", description="Run every solution in parallel and report timings."
+    )
+    parser.add_argument("days", nargs="*", help="days to run, such as day_05")
+    parser.add_argument("--data", default="data", help="directory of the input data")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--output", help="file to write the JSON report to")
+    parser.add_argument(
+        "--history", default=".aoc_timings.json", help="file of previous timings"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="solve without the answer cache"
+    )
+    parser.add_argument(
+        "--model-cache",
+        action="store_true",
+        default=model_cache_enabled(),
+        help="load parsed models from the model cache",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the solutions and emits a JSON report of the answers and timings.
+
+    Parameters
+    ----------
+    argv: list[str] | None
+        The command line arguments, or None to use sys.argv.
+
+    Returns
+    -------
+    None
+    """
+    arguments = parse_arguments(argv)
+    days = arguments.days or discover_days()
+    tasks = create_tasks(days, load_history(arguments.history))
+
+    start_wall_time = time.perf_counter()
+    results = run_tasks(
+        tasks,
+        arguments.data,
+        arguments.workers,
+        not arguments.no_cache,
+        arguments.model_cache,
+    )
+    report = {"wall_time": time.perf_counter() - start_wall_time, "results": results}
+    save_history(arguments.history, results)
+
+    report_json = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(report_json)
+        return
+    with open(arguments.output, "w", encoding="utf-8") as f:
+        f.write(report_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
 """Module for implementing the solution to the problem set on day x."""
 
+Model = str
+
+
+def parse(input_data: str) -> Model:
+    return input_data
+
+
+def solve_part_1(model: Model) -> int: ...
+
+
+def solve_part_2(model: Model) -> int: ...
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    model = parse(input_data)
+    return solve_part_1(model), solve_part_2(model)
+
 
 def part_1_answer(input_data: str) -> int:
-    ...
+    return solve_part_1(parse(input_data))
 
 
 def part_2_answer(input_data: str) -> int:
-    ...
+    return solve_part_2(parse(input_data))
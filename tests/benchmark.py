@@ -0,0 +1,351 @@
+"""Module for benchmarking the solutions to the problems against stored baselines."""
+
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from src.runner import PARTS, discover_days
+
+from .generators import GENERATORS
+from .solution_tester import SolutionTester
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+MIN_REGRESSION_TIME = 0.01
+DEFAULT_SCALE = 20
+CALIBRATION_KEY = "calibration"
+
+Timings = dict[str, dict[str, float]]
+
+
+def load_tester(day: str) -> SolutionTester:
+    """Loads the tester of the solution to the problem set on a day.
+
+    Parameters
+    ----------
+    day: str
+        The day of the problem.
+
+    Returns
+    -------
+    SolutionTester: The tester defined in the test module of that day.
+    """
+    test_module = importlib.import_module(f"tests.test_{day}")
+    tester_class = next(
+        value
+        for value in vars(test_module).values()
+        if isinstance(value, type)
+        and issubclass(value, SolutionTester)
+        and value is not SolutionTester
+    )
+    return tester_class()
+
+
+def summarise(times: list[float]) -> dict[str, float]:
+    """Summarises the times of repeated runs.
+
+    Parameters
+    ----------
+    times: list[float]
+        The times of the runs in seconds.
+
+    Returns
+    -------
+    dict[str, float]: The median and 95th percentile of the times.
+    """
+    if len(times) == 1:
+        return {"median": times[0], "p95": times[0]}
+    p95 = statistics.quantiles(times, n=20, method="inclusive")[18]
+    return {"median": statistics.median(times), "p95": p95}
+
+
+def time_calls(
+    function: Callable[[str], Any], input_data: str, repeat: int
+) -> list[float]:
+    """Times repeated calls of a function on the input data, after one
+    untimed call to warm up any caches.
+
+    Parameters
+    ----------
+    function: Callable[[str], Any]
+        The function to time.
+
+    input_data: str
+        The input data passed to the function.
+
+    repeat: int
+        The number of times to call the function.
+
+    Returns
+    -------
+    list[float]: The time of each call in seconds.
+    """
+    function(input_data)
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(input_data)
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
+def time_phases(
+    module: ModuleType, part: int, input_data: str, repeat: int
+) -> tuple[list[float], list[float]]:
+    """Times repeated parses of the input data and solves of the parsed model,
+    after one untimed run to warm up any caches.
+
+    Each solve is given a freshly parsed model, so that any values the model
+    caches from an earlier solve are not reused.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the parse and solve_part functions.
+
+    part: int
+        The part of the problem.
+
+    input_data: str
+        The input data passed to the parse function.
+
+    repeat: int
+        The number of times to run each phase.
+
+    Returns
+    -------
+    tuple[list[float], list[float]]: The time of each parse and each solve in
+    seconds.
+    """
+    solve_part = getattr(module, f"solve_part_{part}")
+    solve_part(module.parse(input_data))
+    parse_times, solve_times = [], []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        model = module.parse(input_data)
+        parse_times.append(time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        solve_part(model)
+        solve_times.append(time.perf_counter() - start_time)
+    return parse_times, solve_times
+
+
+def calibration_workload() -> int:
+    """A fixed pure Python workload whose time measures the speed of the
+    machine running the benchmarks.
+
+    Returns
+    -------
+    int: The result of the workload, which is unused.
+    """
+    values = [(index * 7919) % 10007 for index in range(200_000)]
+    values.sort()
+    return sum(values)
+
+
+def calibrate(repeat: int) -> Timings:
+    """Times the calibration workload.
+
+    Parameters
+    ----------
+    repeat: int
+        The number of times to run the workload.
+
+    Returns
+    -------
+    Timings: The timings of the workload.
+    """
+    times = time_calls(lambda _: calibration_workload(), "", repeat)
+    return {"workload": summarise(times)}
+
+
+def benchmark_tester(
+    tester: SolutionTester, repeat: int, scale: int | None = None
+) -> dict[str, Timings]:
+    """Benchmarks the parse and solve phases of both parts of a problem.
+
+    The phases are only timed separately for modules that define parse and
+    solve_part functions, otherwise the whole part is timed as the solve phase.
+
+    Parameters
+    ----------
+    tester: SolutionTester
+        The tester of the solution, which provides the module and input data.
+
+    repeat: int
+        The number of times to run each phase.
+
+    scale: int | None
+        The multiple of the puzzle size of a generated input to use instead of
+        the stored input data, or None to use the stored input data.
+
+    Returns
+    -------
+    dict[str, Timings]: The timings of each phase keyed by day and part, such
+    as "day_05/2", with a suffix such as "@100x" for generated inputs.
+    """
+    part_inputs = {1: tester.part_1_input, 2: tester.part_2_input}
+    key_suffix = ""
+    if scale is not None:
+        generated_input = GENERATORS[tester.day](scale, 0).input_data
+        part_inputs = {1: generated_input, 2: generated_input}
+        key_suffix = f"@{scale}x"
+    benchmarks = {}
+
+    for part in PARTS:
+        if hasattr(tester.module, f"solve_part_{part}"):
+            parse_times, solve_times = time_phases(
+                tester.module, part, part_inputs[part], repeat
+            )
+            timings = {"parse": summarise(parse_times), "solve": summarise(solve_times)}
+        else:
+            part_answer = getattr(tester.module, f"part_{part}_answer")
+            solve_times = time_calls(part_answer, part_inputs[part], repeat)
+            timings = {"solve": summarise(solve_times)}
+        benchmarks[f"{tester.day}/{part}{key_suffix}"] = timings
+
+    return benchmarks
+
+
+def load_baseline() -> dict[str, Timings]:
+    """Loads in the stored baseline timings.
+
+    Returns
+    -------
+    dict[str, Timings]: The baseline timings keyed by day and part, which are
+    empty if no baseline has been stored.
+    """
+    if not BASELINE_PATH.is_file():
+        return {}
+    baseline: dict[str, Timings] = json.loads(BASELINE_PATH.read_text())
+    return baseline
+
+
+def find_regressions(
+    benchmarks: dict[str, Timings], baseline: dict[str, Timings], threshold: float
+) -> list[str]:
+    """Finds the phases whose median time regressed beyond the threshold.
+
+    When both timings include the calibration workload, the baseline is first
+    rescaled by the relative speed of the current machine. Differences below
+    MIN_REGRESSION_TIME are ignored, as they are dominated by timing noise.
+
+    Parameters
+    ----------
+    benchmarks: dict[str, Timings]
+        The timings of the current run.
+
+    baseline: dict[str, Timings]
+        The stored baseline timings.
+
+    threshold: float
+        The allowed fractional slowdown, such as 0.5 for 50%.
+
+    Returns
+    -------
+    list[str]: A description of each regression.
+    """
+    speed_ratio = 1.0
+    if CALIBRATION_KEY in benchmarks and CALIBRATION_KEY in baseline:
+        speed_ratio = (
+            benchmarks[CALIBRATION_KEY]["workload"]["median"]
+            / baseline[CALIBRATION_KEY]["workload"]["median"]
+        )
+
+    regressions = []
+    for key, timings in benchmarks.items():
+        for phase, summary in timings.items():
+            if key == CALIBRATION_KEY or phase not in baseline.get(key, {}):
+                continue
+            baseline_median = baseline[key][phase]["median"] * speed_ratio
+            median = summary["median"]
+            if (
+                median > baseline_median * (1 + threshold)
+                and median - baseline_median > MIN_REGRESSION_TIME
+            ):
+                regressions.append(
+                    f"{key} {phase}: {median:.4f}s against a baseline of "
+                    f"{baseline_median:.4f}s"
+                )
+    return regressions
+
+
+def parse_arguments(argv: list[str] | None) -> argparse.Namespace:
+    """Parses the command line arguments of the benchmarks.
+
+    Parameters
+    ----------
+    argv: list[str] | None
+        The command line arguments, or None to use sys.argv.
+
+    Returns
+    -------
+    argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the solutions against the stored baseline."
+    )
+    parser.add_argument("days", nargs="*", help="days to benchmark, such as day_05")
+    parser.add_argument("--repeat", type=int, default=10, help="runs of each phase")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=DEFAULT_SCALE,
+        help="benchmark generated inputs of this multiple",
+    )
+    parser.add_argument(
+        "--stored-inputs",
+        action="store_true",
+        help="benchmark the stored inputs instead of generated inputs",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.5, help="allowed fractional slowdown"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the timings as the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Benchmarks the solutions and compares them with the stored baseline.
+
+    Parameters
+    ----------
+    argv: list[str] | None
+        The command line arguments, or None to use sys.argv.
+
+    Returns
+    -------
+    int: The exit status, which is 1 if any phase regressed and 0 otherwise.
+    """
+    arguments = parse_arguments(argv)
+    scale = None if arguments.stored_inputs else arguments.scale
+    benchmarks = {CALIBRATION_KEY: calibrate(arguments.repeat)}
+    for day in arguments.days or discover_days():
+        tester = load_tester(day)
+        benchmarks |= benchmark_tester(tester, arguments.repeat, scale)
+
+    print(json.dumps(benchmarks, indent=2))
+
+    baseline = load_baseline()
+    if arguments.update_baseline:
+        BASELINE_PATH.write_text(json.dumps(baseline | benchmarks, indent=2) + "\n")
+        return 0
+
+    regressions = find_regressions(benchmarks, baseline, arguments.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
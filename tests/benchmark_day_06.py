@@ -0,0 +1,115 @@
+"""Module for benchmarking the exact race solver on day 6 against the float solver."""
+
+import math
+import random
+import timeit
+
+from src.day_06 import winning_races
+
+DIGIT_COUNTS = [5, 10, 15, 20, 50, 100, 300, 1000, 3000]
+
+
+def float_winning_races(time: int, distance: int) -> int:
+    """Counts the winning hold times using floating point square roots, as the
+    solution did before the exact integer solver.
+
+    Parameters
+    ----------
+    time: int
+        The duration of the race.
+
+    distance: int
+        The record distance to beat.
+
+    Returns
+    -------
+    int: The number of winning hold times, which is inexact beyond 2^53.
+    """
+    discriminant = math.sqrt(time**2 - 4 * distance)
+    least_time = math.floor((time - discriminant) / 2 + 1)
+    most_time = math.ceil((time + discriminant) / 2 - 1)
+    return most_time - least_time + 1
+
+
+def create_race(num_digits: int, rng: random.Random) -> tuple[int, int]:
+    """Creates a race with a time of the given number of digits and a record
+    distance that leaves some winning hold times.
+
+    Parameters
+    ----------
+    num_digits: int
+        The number of digits in the duration of the race.
+
+    rng: random.Random
+        The random number generator used to create the race.
+
+    Returns
+    -------
+    tuple[int, int]: The duration of the race and the record distance.
+    """
+    time = rng.randrange(10 ** (num_digits - 1), 10**num_digits)
+    distance = rng.randrange(time**2 // 8, time**2 // 4)
+    return time, distance
+
+
+def time_solver(solver_code: str, namespace: dict[str, object]) -> float:
+    """Times a single call of a race solver.
+
+    Parameters
+    ----------
+    solver_code: str
+        The code calling the solver.
+
+    namespace: dict[str, object]
+        The names used by the code calling the solver.
+
+    Returns
+    -------
+    float: The best time per call in seconds.
+    """
+    timer = timeit.Timer(solver_code, globals=namespace)
+    num_calls, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=num_calls)) / num_calls
+
+
+def display_benchmarks(seed: int = 0) -> None:
+    """Displays the time per race and the accuracy of the exact and float
+    solvers for races of growing digit counts.
+
+    Parameters
+    ----------
+    seed: int
+        The seed of the random number generator used to create the races.
+
+    Returns
+    -------
+    None
+    """
+    rng = random.Random(seed)
+    print(f"{'digits':>6} {'exact (s)':>12} {'float (s)':>12}  float result")
+
+    for num_digits in DIGIT_COUNTS:
+        time, distance = create_race(num_digits, rng)
+        namespace: dict[str, object] = {
+            "winning_races": winning_races,
+            "float_winning_races": float_winning_races,
+            "time": time,
+            "distance": distance,
+        }
+        exact_time = time_solver("winning_races(time, distance)", namespace)
+
+        try:
+            float_answer = float_winning_races(time, distance)
+            float_time = time_solver("float_winning_races(time, distance)", namespace)
+        except OverflowError:
+            print(f"{num_digits:>6} {exact_time:12.3e} {'-':>12}  overflow")
+            continue
+
+        float_result = (
+            "exact" if float_answer == winning_races(time, distance) else "wrong"
+        )
+        print(f"{num_digits:>6} {exact_time:12.3e} {float_time:12.3e}  {float_result}")
+
+
+if __name__ == "__main__":
+    display_benchmarks()
@@ -0,0 +1,11 @@
+"""Module for configuring the test suite.
+
+The answer cache on disk is bypassed by default, so that every test runs the
+code it covers. Set AOC_NO_CACHE to an empty value to use the cache anyway.
+"""
+
+import os
+
+from src.answer_cache import BYPASS_VARIABLE
+
+os.environ.setdefault(BYPASS_VARIABLE, "1")
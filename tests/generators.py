@@ -0,0 +1,371 @@
+"""Module for generating synthetic inputs of any size for the problems."""
+
+import math
+import random
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable
+
+DIGIT_NAMES = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+FILLER_LETTERS = "abcdjklmpqy"
+SYMBOLS = "*#+$/@=%&-"
+COLOURS = ["red", "green", "blue"]
+COLOUR_LIMITS = [12, 13, 14]
+MAPPING_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+@dataclass
+class GeneratedInput:
+    """Synthetic input data for a problem, with the expected answers where
+    they are cheap to compute while generating.
+
+    Attributes
+    ----------
+    input_data: str
+        The generated input data.
+
+    part_1_output: int | None
+        The expected solution to part 1, or None if it is not known.
+
+    part_2_output: int | None
+        The expected solution to part 2, or None if it is not known.
+    """
+
+    input_data: str
+    part_1_output: int | None = None
+    part_2_output: int | None = None
+
+
+def generate_day_01(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates calibration lines, where 1000 lines is the puzzle size.
+
+    Tokens are separated by letters that do not appear in any digit name, so
+    digit names never overlap and the first and last tokens give the answers.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The calibration lines and the expected answers.
+    """
+    rng = random.Random(seed)
+    lines, part_1_output, part_2_output = [], 0, 0
+
+    for _ in range(1000 * scale):
+        digits = [rng.randint(1, 9) for _ in range(rng.randint(1, 6))]
+        is_name = [rng.random() < 0.5 for _ in digits]
+        is_name[rng.randrange(len(digits))] = False
+
+        tokens = [
+            DIGIT_NAMES[digit - 1] if name else str(digit)
+            for digit, name in zip(digits, is_name)
+        ]
+        fillers = [
+            "".join(rng.choices(FILLER_LETTERS, k=rng.randint(1, 4))) for _ in tokens
+        ]
+        lines.append("".join(filler + token for filler, token in zip(fillers, tokens)))
+
+        plain_digits = [digit for digit, name in zip(digits, is_name) if not name]
+        part_1_output += 10 * plain_digits[0] + plain_digits[-1]
+        part_2_output += 10 * digits[0] + digits[-1]
+
+    return GeneratedInput("\n".join(lines), part_1_output, part_2_output)
+
+
+def generate_game(rng: random.Random, game_id: int) -> tuple[str, list[int]]:
+    """Generates a game that draws every colour at least once.
+
+    Parameters
+    ----------
+    rng: random.Random
+        The random number generator used to create the game.
+
+    game_id: int
+        The ID of the game.
+
+    Returns
+    -------
+    tuple[str, list[int]]: The line of the game and the maximum amount drawn
+    of each colour.
+    """
+    rounds = [rng.sample(COLOURS, rng.randint(1, 3)) for _ in range(rng.randint(1, 6))]
+    rounds.append(COLOURS)
+    max_amounts = dict.fromkeys(COLOURS, 0)
+    round_strings = []
+
+    for colours in rounds:
+        amounts = [rng.randint(1, 20) for _ in colours]
+        for colour, amount in zip(colours, amounts):
+            max_amounts[colour] = max(max_amounts[colour], amount)
+        draws = (f"{amount} {colour}" for colour, amount in zip(colours, amounts))
+        round_strings.append(", ".join(draws))
+
+    line = f"Game {game_id}: {'; '.join(round_strings)}"
+    return line, [max_amounts[colour] for colour in COLOURS]
+
+
+def generate_day_02(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates a game log, where 100 games is the puzzle size.
+
+    Every game draws every colour at least once.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The game log and the expected answers.
+    """
+    rng = random.Random(seed)
+    lines, part_1_output, part_2_output = [], 0, 0
+
+    for game_id in range(1, 100 * scale + 1):
+        line, maxima = generate_game(rng, game_id)
+        lines.append(line)
+        if all(amount <= limit for amount, limit in zip(maxima, COLOUR_LIMITS)):
+            part_1_output += game_id
+        part_2_output += math.prod(maxima)
+
+    return GeneratedInput("\n".join(lines), part_1_output, part_2_output)
+
+
+def generate_day_03(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates an engine schematic, where 140 rows of 140 columns is the
+    puzzle size. Only the number of rows grows with the scale.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The engine schematic, without expected answers.
+    """
+    rng = random.Random(seed)
+    width, rows = 140, []
+
+    for _ in range(140 * scale):
+        row = ""
+        while len(row) < width:
+            choice = rng.random()
+            if choice < 0.1:
+                row += str(rng.randint(1, 999))
+            elif choice < 0.14:
+                row += rng.choice(SYMBOLS)
+            row += "." * rng.randint(1, 4)
+        rows.append(row[:width])
+
+    return GeneratedInput("\n".join(rows))
+
+
+def generate_card(rng: random.Random, card_id: int, num_matches: int) -> str:
+    """Generates a scratchcard with 10 numbers and 25 winning numbers.
+
+    Parameters
+    ----------
+    rng: random.Random
+        The random number generator used to create the card.
+
+    card_id: int
+        The ID of the card.
+
+    num_matches: int
+        The number of numbers that are winning numbers.
+
+    Returns
+    -------
+    str: The line of the card.
+    """
+    num_numbers, num_winning_numbers = 10, 25
+    pool = rng.sample(range(1, 100), num_numbers + num_winning_numbers - num_matches)
+    numbers = pool[:num_numbers]
+    winning_numbers = numbers[:num_matches] + pool[num_numbers:]
+    rng.shuffle(winning_numbers)
+
+    number_string = " ".join(f"{number:2}" for number in numbers)
+    winning_string = " ".join(f"{number:2}" for number in winning_numbers)
+    return f"Card {card_id:>3}: {number_string} | {winning_string}"
+
+
+def generate_day_04(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates a deck of scratchcards, where 200 cards is the puzzle size.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The deck of scratchcards and the expected answers.
+    """
+    rng = random.Random(seed)
+    num_cards = 200 * scale
+    lines, match_counts = [], []
+
+    for index in range(num_cards):
+        num_matches = rng.randint(0, min(10, num_cards - index - 1))
+        lines.append(generate_card(rng, index + 1, num_matches))
+        match_counts.append(num_matches)
+
+    copies = [1] * num_cards
+    for index, num_matches in enumerate(match_counts):
+        for won_index in range(index + 1, index + 1 + num_matches):
+            copies[won_index] += copies[index]
+
+    part_1_output = sum(1 << (count - 1) for count in match_counts if count)
+    return GeneratedInput("\n".join(lines), part_1_output, sum(copies))
+
+
+def generate_mapping(
+    rng: random.Random, num_ranges: int, max_value: int
+) -> list[tuple[int, int, int]]:
+    """Generates the disjoint ranges of a mapping.
+
+    Parameters
+    ----------
+    rng: random.Random
+        The random number generator used to create the ranges.
+
+    num_ranges: int
+        The number of ranges in the mapping.
+
+    max_value: int
+        The exclusive upper bound of every number in the mapping.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]: The destination start, source start and length
+    of each range, ordered by source start.
+    """
+    bounds = sorted(rng.sample(range(max_value), 2 * num_ranges))
+    return [
+        (rng.randrange(max_value - (end - start)), start, end - start)
+        for start, end in zip(bounds[::2], bounds[1::2])
+    ]
+
+
+def map_locations(ranges: list[tuple[int, int, int]], locations: list[int]) -> None:
+    """Maps locations in place through the ranges of a mapping.
+
+    Parameters
+    ----------
+    ranges: list[tuple[int, int, int]]
+        The destination start, source start and length of each range, ordered
+        by source start.
+
+    locations: list[int]
+        The locations to map.
+
+    Returns
+    -------
+    None
+    """
+    starts = [start for _, start, _ in ranges]
+    for index, location in enumerate(locations):
+        range_index = bisect_right(starts, location) - 1
+        if range_index >= 0:
+            destination, start, length = ranges[range_index]
+            if location < start + length:
+                locations[index] = location + destination - start
+
+
+def generate_day_05(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates an almanac, where 20 seeds and 30 ranges per mapping is the
+    puzzle size.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The almanac and the expected answer to part 1.
+    """
+    rng = random.Random(seed)
+    max_value = 2**32
+    seeds = [
+        number
+        for _ in range(10 * scale)
+        for number in (rng.randrange(max_value // 2), rng.randrange(1, 2**28))
+    ]
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    locations = seeds.copy()
+
+    for mapping_name in MAPPING_NAMES:
+        ranges = generate_mapping(rng, 30 * scale, max_value)
+        range_lines = [" ".join(map(str, mapping_range)) for mapping_range in ranges]
+        sections.append(
+            "\n".join([f"{mapping_name} map:", *rng.sample(range_lines, len(ranges))])
+        )
+        map_locations(ranges, locations)
+
+    return GeneratedInput("\n\n".join(sections), min(locations))
+
+
+def generate_day_06(scale: int = 1, seed: int = 0) -> GeneratedInput:
+    """Generates a race table, where 4 races is the puzzle size.
+
+    Parameters
+    ----------
+    scale: int
+        The multiple of the puzzle size to generate.
+
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedInput: The race table and the expected answer to part 1.
+    """
+    rng = random.Random(seed)
+    times = [rng.randint(10, 99) for _ in range(4 * scale)]
+    distances = [rng.randrange(time, time * time // 4) for time in times]
+
+    races_won = (
+        sum(1 for hold_time in range(time) if hold_time * (time - hold_time) > distance)
+        for time, distance in zip(times, distances)
+    )
+    time_line = "Time:    " + " ".join(f"{time:>5}" for time in times)
+    distance_line = "Distance:" + " ".join(f"{distance:>5}" for distance in distances)
+    return GeneratedInput(f"{time_line}\n{distance_line}", math.prod(races_won))
+
+
+GENERATORS: dict[str, Callable[[int, int], GeneratedInput]] = {
+    "day_01": generate_day_01,
+    "day_02": generate_day_02,
+    "day_03": generate_day_03,
+    "day_04": generate_day_04,
+    "day_05": generate_day_05,
+    "day_06": generate_day_06,
+}
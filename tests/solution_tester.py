@@ -1,11 +1,74 @@
 """Module for defining the structure of the tests of the solutions to the problems."""
 
 import importlib
-import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from types import ModuleType
 from typing import Any
 
+import pytest
+
+from src.answer_cache import cached_answers
+from src.data_loader import load_text
+from src.model_cache import model_cache_enabled, parse_input
+
+MAX_MODELS = 4
+
+
+@lru_cache(maxsize=MAX_MODELS)
+def parsed_model(module: ModuleType, input_data: str) -> Any:
+    """The parsed model of an input, of which only the most recently used
+    models are kept so that the inputs of earlier days are not held onto.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the parse function of the problem.
+
+    input_data: str
+        The input data to parse.
+
+    Returns
+    -------
+    Any: The parsed model.
+    """
+    return parse_input(module, input_data, model_cache_enabled())
+
+
+def part_output(module: ModuleType, part: int, part_input: str) -> Any:
+    """The solution to a part of a problem.
+
+    Recently used inputs are parsed once into a model shared by both parts,
+    while each part is solved separately so that an error in one part does
+    not fail the tests of the other. Solutions are loaded from the answer
+    cache on disk unless it is bypassed, and parsed models from the model
+    cache on disk when it is enabled.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The module containing the solution to the problem.
+
+    part: int
+        The part of the problem.
+
+    part_input: str
+        The input data for the part of the problem.
+
+    Returns
+    -------
+    Any: The solution to the part of the problem.
+    """
+
+    def solve() -> list[Any]:
+        if not hasattr(module, "parse"):
+            return [getattr(module, f"part_{part}_answer")(part_input)]
+        model = parsed_model(module, part_input)
+        return [getattr(module, f"solve_part_{part}")(model)]
+
+    answers, _ = cached_answers(module, (part,), part_input, solve)
+    return answers[0]
+
 
 class SolutionTester(ABC):
     """Abstract base class for defining the structure of the tests of the
@@ -98,23 +161,10 @@ class SolutionTester(ABC):
         -------
         str: The data in the file.
         """
-        with open(self.file_path(file_name), encoding="utf-8") as f:
-            data = f.read()
-        return data.rstrip()
-
-    def file_exists(self, file_name: str) -> bool:
-        """Checks if the file name exists.
-
-        Parameters
-        ----------
-        file_name: str
-            The file name of the data.
-
-        Returns
-        -------
-        bool: True if the file name exists, False if not.
-        """
-        return os.path.isfile(self.file_path(file_name))
+        data = load_text(self.file_path(file_name))
+        if data is None:
+            raise FileNotFoundError(self.file_path(file_name))
+        return data
 
     @property
     def example_input_data(self) -> str:
@@ -134,8 +184,9 @@ class SolutionTester(ABC):
         -------
         str: The example input data for part 1 of the problem.
         """
-        if self.file_exists("example_part_1_input"):
-            return self.load_data("example_part_1_input")
+        data = load_text(self.file_path("example_part_1_input"))
+        if data is not None:
+            return data
         return self.example_input_data
 
     @property
@@ -146,8 +197,9 @@ class SolutionTester(ABC):
         -------
         str: The example input data for part 2 of the problem.
         """
-        if self.file_exists("example_part_2_input"):
-            return self.load_data("example_part_2_input")
+        data = load_text(self.file_path("example_part_2_input"))
+        if data is not None:
+            return data
         return self.example_input_data
 
     @property
@@ -168,8 +220,9 @@ class SolutionTester(ABC):
         -------
         str: The input data for part 1 of the problem.
         """
-        if self.file_exists("part_1_input"):
-            return self.load_data("part_1_input")
+        data = load_text(self.file_path("part_1_input"))
+        if data is not None:
+            return data
         return self.input_data
 
     @property
@@ -180,8 +233,9 @@ class SolutionTester(ABC):
         -------
         str: The input data for part 2 of the problem.
         """
-        if self.file_exists("part_2_input"):
-            return self.load_data("part_2_input")
+        data = load_text(self.file_path("part_2_input"))
+        if data is not None:
+            return data
         return self.input_data
 
     @property
@@ -192,7 +246,7 @@ class SolutionTester(ABC):
         -------
         Any: The solution to the example part 1 of the problem.
         """
-        return self.module.part_1_answer(self.example_part_1_input)
+        return part_output(self.module, 1, self.example_part_1_input)
 
     @property
     def part_1_output(self) -> Any:
@@ -202,7 +256,7 @@ class SolutionTester(ABC):
         -------
         Any: The solution to part 1 of the problem.
         """
-        return self.module.part_1_answer(self.part_1_input)
+        return part_output(self.module, 1, self.part_1_input)
 
     @property
     def example_part_2_output(self) -> Any:
@@ -212,7 +266,7 @@ class SolutionTester(ABC):
         -------
         Any: The solution to the example part 2 of the problem.
         """
-        return self.module.part_2_answer(self.example_part_2_input)
+        return part_output(self.module, 2, self.example_part_2_input)
 
     @property
     def part_2_output(self) -> Any:
@@ -222,7 +276,7 @@ class SolutionTester(ABC):
         -------
         Any: The solution to part 2 of the problem.
         """
-        return self.module.part_2_answer(self.part_2_input)
+        return part_output(self.module, 2, self.part_2_input)
 
     @abstractmethod
     def test_example_part_1(self) -> None:
@@ -272,6 +326,19 @@ class SolutionTester(ABC):
         None
         """
 
+    def test_solve(self) -> None:
+        """Tests that solving both parts of the problem from a shared input
+        matches the solutions to the parts solved separately.
+
+        Returns
+        -------
+        None
+        """
+        if self.part_1_input != self.part_2_input:
+            pytest.skip("the parts of the problem do not share an input")
+        outputs = self.module.solve(self.part_1_input)
+        assert outputs == (self.part_1_output, self.part_2_output)
+
     @classmethod
     def display_outputs(cls) -> None:
         """Displays the solutions to all parts of the problem.
@@ -0,0 +1,69 @@
+"""Module for testing the answer cache on disk."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src import answer_cache, day_01
+
+
+def test_cached_answers_are_reused(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(answer_cache.BYPASS_VARIABLE, raising=False)
+    calls: list[None] = []
+
+    def solve() -> list[int]:
+        calls.append(None)
+        return [1, 2]
+
+    assert answer_cache.cached_answers(day_01, (1, 2), "1abc2", solve, tmp_path) == (
+        [1, 2],
+        False,
+    )
+    assert answer_cache.cached_answers(day_01, (1, 2), "1abc2", solve, tmp_path) == (
+        [1, 2],
+        True,
+    )
+    assert (
+        answer_cache.cached_answers(day_01, (1,), "1abc2", solve, tmp_path)[1] is False
+    )
+    assert (
+        answer_cache.cached_answers(day_01, (1, 2), "3abc4", solve, tmp_path)[1]
+        is False
+    )
+    assert len(calls) == 3
+
+
+def test_bypass_variable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(answer_cache.BYPASS_VARIABLE, "1")
+    answer_cache.cached_answers(day_01, (1,), "1abc2", lambda: [12], tmp_path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    for index in range(4):
+        answer_cache.store_answers(f"key_{index}", [index], tmp_path, max_entries=3)
+        os.utime(tmp_path / f"key_{index}.json", ns=(index, index))
+
+    assert answer_cache.load_answers("key_0", tmp_path) is None
+    assert answer_cache.load_answers("key_1", tmp_path) == [1]
+
+    answer_cache.store_answers("key_4", [4], tmp_path, max_entries=3)
+    assert answer_cache.load_answers("key_2", tmp_path) is None
+    assert answer_cache.load_answers("key_1", tmp_path) == [1]
+
+
+def test_key_covers_imported_modules() -> None:
+    source_names = [path.name for path in answer_cache.source_paths("src.day_05")]
+    assert source_names == [
+        "answer_cache.py",
+        "day_05.py",
+        "model_cache.py",
+        "optional_numpy.py",
+    ]
+    assert answer_cache.source_paths("src.day_01") == [
+        answer_cache.SOURCE_DIRECTORY / "day_01.py",
+        answer_cache.SOURCE_DIRECTORY / "optional_numpy.py",
+    ]
@@ -0,0 +1,31 @@
+"""Module for testing the shared loader of the input data files."""
+
+import os
+from pathlib import Path
+
+from src.data_loader import load_text
+
+
+def test_load_text_is_cached(tmp_path: Path) -> None:
+    file_path = tmp_path / "input.txt"
+    file_path.write_text("1 2 3\n", encoding="utf-8")
+
+    data = load_text(file_path)
+    assert data == "1 2 3"
+    assert load_text(file_path) is data
+
+
+def test_load_text_reloads_changed_files(tmp_path: Path) -> None:
+    file_path = tmp_path / "input.txt"
+    file_path.write_text("1 2 3\n", encoding="utf-8")
+    assert load_text(file_path) == "1 2 3"
+
+    file_path.write_text("4 5 6 7\n", encoding="utf-8")
+    os.utime(file_path, ns=(0, 0))
+    assert load_text(file_path) == "4 5 6 7"
+
+
+def test_load_text_missing_and_empty_files(tmp_path: Path) -> None:
+    assert load_text(tmp_path / "missing.txt") is None
+    (tmp_path / "empty.txt").touch()
+    assert load_text(tmp_path / "empty.txt") == ""
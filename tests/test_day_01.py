@@ -22,6 +22,10 @@ class TestDay01(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 54100
 
+    def test_part_1_from_file(self) -> None:
+        file_path = self.file_path("input")
+        assert self.module.calculate_digit_sum_from_file(file_path) == 54877
+
 
 if __name__ == "__main__":
     TestDay01.display_outputs()
@@ -1,5 +1,7 @@
 """Module for testing the solution to the problem set on day 2."""
 
+import random
+
 from .solution_tester import SolutionTester
 
 
@@ -22,6 +24,28 @@ class TestDay02(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 71274
 
+    def test_limit_sweep(self) -> None:
+        games = self.module.create_games(self.input_data)
+        maxima = list(zip(games.ids, *games.columns.values()))
+
+        rng = random.Random(0)
+        sweep = [(0, 0, 0), (5, 20, 3), (12, 13, 14), (20, 20, 20)]
+        sweep += [
+            (rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 20))
+            for _ in range(200)
+        ]
+        expected = [
+            sum(
+                game_id
+                for game_id, *max_amounts in maxima
+                if all(amount <= limit for amount, limit in zip(max_amounts, limits))
+            )
+            for limits in sweep
+        ]
+
+        assert [games.possible_id_sum(limits) for limits in sweep] == expected
+        assert games.possible_id_sums(sweep) == expected
+
 
 if __name__ == "__main__":
     TestDay02.display_outputs()
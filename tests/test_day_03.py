@@ -1,5 +1,8 @@
 """Module for testing the solution to the problem set on day 3."""
 
+import io
+import random
+
 from .solution_tester import SolutionTester
 
 
@@ -22,6 +25,36 @@ class TestDay03(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 73201705
 
+    def test_streaming(self) -> None:
+        with open(self.file_path("input"), encoding="utf-8") as f:
+            assert self.module.stream_totals(f) == (527446, 73201705)
+
+    def test_incremental_edits(self) -> None:
+        schematic = self.module.Schematic.from_string(self.example_input_data)
+        rng = random.Random(0)
+
+        for _ in range(200):
+            row = rng.randrange(len(schematic.rows))
+            column = rng.randrange(len(schematic.rows[row]))
+            schematic.set_cell(row, column, rng.choice("..123*#"))
+
+            input_data = "\n".join(row.decode() for row in schematic.rows)
+            grid = self.module.Grid.from_string(input_data)
+            assert schematic.part_number_sum == sum(grid.part_numbers)
+            assert schematic.gear_ratio_sum == sum(grid.gear_ratios)
+
+    def test_edges_do_not_wrap(self) -> None:
+        grid = self.module.Grid.from_string("*..\n...\n..7")
+        assert not grid.part_numbers
+
+    def test_carriage_returns_are_not_symbols(self) -> None:
+        input_data = "...5\r\n....\r\n...."
+        assert self.module.part_1_answer(input_data) == 0
+        assert self.module.stream_totals(io.StringIO(input_data, newline="")) == (0, 0)
+        crlf_input = self.example_input_data.replace("\n", "\r\n")
+        assert self.module.part_1_answer(crlf_input) == 4361
+        assert self.module.part_2_answer(crlf_input) == 467835
+
 
 if __name__ == "__main__":
     TestDay03.display_outputs()
@@ -1,5 +1,7 @@
 """Module for testing the solution to the problem set on day 4."""
 
+import pytest
+
 from .solution_tester import SolutionTester
 
 
@@ -22,6 +24,42 @@ class TestDay04(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 5921508
 
+    def test_card_matrix(self) -> None:
+        pytest.importorskip("numpy")
+        cards = self.module.Cards.from_string(self.input_data)
+        card_matrix = self.module.CardMatrix.from_string(self.input_data)
+        assert card_matrix.match_counts.tolist() == [
+            card.num_matches for card in cards.cards
+        ]
+        assert card_matrix.total_score == cards.total_score
+        assert card_matrix.total_cards == cards.total_cards
+
+    def test_append(self) -> None:
+        card_lines = self.input_data.splitlines()
+        cards = self.module.Cards([])
+
+        for num_cards, card_line in enumerate(card_lines, start=1):
+            cards.append(card_line)
+            if num_cards % 50 == 0:
+                expected = self.module.Cards.from_string(
+                    "\n".join(card_lines[:num_cards])
+                )
+                assert cards.total_score == expected.total_score
+                assert cards.total_cards == expected.total_cards
+
+        assert (cards.total_score, cards.total_cards) == (18653, 5921508)
+
+    def test_streaming(self) -> None:
+        with open(self.file_path("input"), encoding="utf-8") as f:
+            assert self.module.stream_totals(f) == (18653, 5921508)
+
+    def test_long_card_chain(self) -> None:
+        num_cards = 100_000
+        lines = [f"Card {card_id}: 1 | 1" for card_id in range(1, num_cards)]
+        lines.append(f"Card {num_cards}: 1 | 2")
+        cards = self.module.Cards.from_string("\n".join(lines))
+        assert cards.total_cards == num_cards * (num_cards + 1) // 2
+
 
 if __name__ == "__main__":
     TestDay04.display_outputs()
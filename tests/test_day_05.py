@@ -1,5 +1,9 @@
 """Module for testing the solution to the problem set on day 5."""
 
+import io
+
+import pytest
+
 from .solution_tester import SolutionTester
 
 
@@ -22,6 +26,36 @@ class TestDay05(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 136096660
 
+    def test_array_backend(self) -> None:
+        np = pytest.importorskip("numpy")
+        almanac = self.module.Almanac.from_string(self.input_data)
+        seeds = np.sort(np.array(almanac.seeds, dtype=np.int64))
+        array_locations = almanac.map_seed_array(seeds).tolist()
+        assert array_locations == almanac.composed_mapping.map_many(
+            sorted(almanac.seeds)
+        )
+
+    def test_negative_numbers(self) -> None:
+        composed_mapping = self.module.ComposedMapping([0, 10], [0, 5])
+        assert composed_mapping.map_number(0) == 0
+        with pytest.raises(ValueError):
+            composed_mapping.map_number(-1)
+        with pytest.raises(ValueError):
+            composed_mapping.map_many([-1, 3])
+
+    def test_streaming(self) -> None:
+        with open(self.file_path("input"), encoding="utf-8") as f:
+            assert self.module.Almanac.stream_closest_location(f) == 825516882
+            assert (
+                self.module.Almanac.stream_closest_location(f, seed_range=True)
+                == 136096660
+            )
+
+        empty_range_input = "seeds: 3 0 65 5\n\nx map:\n0 60 10"
+        assert self.module.part_2_answer(empty_range_input) == 5
+        with io.StringIO(empty_range_input) as f:
+            assert self.module.Almanac.stream_closest_location(f, seed_range=True) == 5
+
 
 if __name__ == "__main__":
     TestDay05.display_outputs()
@@ -1,5 +1,8 @@
 """Module for testing the solution to the problem set on day 6."""
 
+import math
+import random
+
 from .solution_tester import SolutionTester
 
 
@@ -22,6 +25,25 @@ class TestDay06(SolutionTester):
     def test_part_2(self) -> None:
         assert self.part_2_output == 33875953
 
+    def test_batch_races(self) -> None:
+        rng = random.Random(0)
+        for max_time in [100, 2**31, 10**30]:
+            times = [rng.randrange(max_time) for _ in range(1000)]
+            distances = [rng.randrange(time**2 // 4 + 2) for time in times]
+            races_won, product = self.module.batch_winning_races(times, distances)
+            expected = list(map(self.module.winning_races, times, distances))
+            assert races_won == expected
+            assert product == math.prod(expected)
+
+    def test_exact_large_races(self) -> None:
+        time = 10**40 + 7
+        least_time = 10**19 + 3
+        distance = least_time * (time - least_time) - 1
+        assert self.module.winning_races(time, distance) == time - 2 * least_time + 1
+        assert (
+            self.module.winning_races(time, distance + 1) == time - 2 * least_time - 1
+        )
+
 
 if __name__ == "__main__":
     TestDay06.display_outputs()
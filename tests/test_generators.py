@@ -0,0 +1,22 @@
+"""Module for testing the synthetic inputs against the solutions to the problems."""
+
+import importlib
+
+import pytest
+
+from .generators import GENERATORS
+
+
+@pytest.mark.parametrize("day", GENERATORS)
+@pytest.mark.parametrize("scale", [1, 3])
+def test_generated_answers(day: str, scale: int) -> None:
+    module = importlib.import_module(f"src.{day}")
+    generated = GENERATORS[day](scale, scale)
+
+    part_1_output = module.part_1_answer(generated.input_data)
+    part_2_output = module.part_2_answer(generated.input_data)
+
+    if generated.part_1_output is not None:
+        assert part_1_output == generated.part_1_output
+    if generated.part_2_output is not None:
+        assert part_2_output == generated.part_2_output
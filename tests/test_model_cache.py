@@ -0,0 +1,67 @@
+"""Module for testing the cache of parsed models on disk."""
+
+import importlib
+from array import array
+from pathlib import Path
+
+import pytest
+
+from src import day_01, day_04, day_05, model_cache
+from src.data_loader import load_text
+
+
+def test_pack_arrays_round_trip() -> None:
+    arrays = [array("I", [1, 2, 3]), array("q", [-(2**40), 0]), array("B")]
+    data = model_cache.pack_arrays("Model", arrays)
+    assert model_cache.unpack_arrays("Model", data) == arrays
+
+    with pytest.raises(ValueError):
+        model_cache.unpack_arrays("OtherModel", data)
+    with pytest.raises(ValueError):
+        model_cache.unpack_arrays("Model", data + b"\0")
+
+
+@pytest.mark.parametrize("day", ["day_02", "day_03", "day_04", "day_05"])
+def test_model_round_trip(day: str) -> None:
+    module = importlib.import_module(f"src.{day}")
+    input_data = load_text(f"data/{day}/example_input.txt")
+    assert input_data is not None
+
+    model = module.parse(input_data)
+    loaded_model = type(model).from_bytes(model.to_bytes())
+    assert loaded_model == model
+    assert module.solve_part_1(loaded_model) == module.solve_part_1(model)
+    assert module.solve_part_2(loaded_model) == module.solve_part_2(model)
+
+
+def test_load_or_parse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_data = load_text("data/day_05/example_input.txt")
+    assert input_data is not None
+
+    almanac = model_cache.load_or_parse(day_05, input_data, tmp_path)
+    assert model_cache.model_path(day_05, input_data, tmp_path).is_file()
+
+    def parse(_: str) -> day_05.Almanac:
+        raise AssertionError("the almanac should be loaded from the cache")
+
+    monkeypatch.setattr(day_05, "parse", parse)
+    assert model_cache.load_or_parse(day_05, input_data, tmp_path) == almanac
+
+
+def test_unserialisable_models_are_not_cached(tmp_path: Path) -> None:
+    assert model_cache.load_or_parse(day_01, "1abc2", tmp_path) == b"1abc2"
+    assert not list(tmp_path.iterdir())
+
+
+def test_empty_deck_round_trip() -> None:
+    cards = day_04.Cards.from_string("")
+    assert day_04.Cards.from_bytes(cards.to_bytes()) == cards
+
+    blank_cards = day_04.Cards([day_04.Card(1, 0, 0), day_04.Card(2, 0, 0)])
+    assert day_04.Cards.from_bytes(blank_cards.to_bytes()) == blank_cards
+
+
+def test_model_path_depends_on_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    path = model_cache.model_path(day_05, "seeds: 1 2")
+    monkeypatch.setattr(model_cache, "source_digest", lambda _: "edited parser")
+    assert model_cache.model_path(day_05, "seeds: 1 2") != path
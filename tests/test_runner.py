@@ -0,0 +1,75 @@
+"""Module for testing the runner of the solutions."""
+
+from pathlib import Path
+
+import pytest
+
+from src import day_06, runner
+
+EXAMPLE_INPUT = "Time:      7  15   30\nDistance:  9  40  200\n"
+
+
+@pytest.fixture(name="data_directory")
+def fixture_data_directory(tmp_path: Path) -> str:
+    """Creates a data directory containing the example input of day 6.
+
+    Parameters
+    ----------
+    tmp_path: Path
+        The temporary directory of the test.
+
+    Returns
+    -------
+    str: The data directory.
+    """
+    day_directory = tmp_path / "day_06"
+    day_directory.mkdir()
+    (day_directory / "input.txt").write_text(EXAMPLE_INPUT, encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_run_task(data_directory: str) -> None:
+    results = runner.run_task(("day_06", 2), data_directory, use_cache=False)
+    assert [(result["day"], result["phase"]) for result in results] == [
+        ("day_06", "parse"),
+        ("day_06", "solve"),
+    ]
+    assert all(result["part"] == 2 for result in results)
+    assert results[-1]["answers"] == [71503]
+    assert results[-1]["cached"] is False
+    assert all(result["peak_rss_kb"] > 0 for result in results)
+
+
+def test_solve_phases_reports_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def solve_part_1(_: object) -> int:
+        raise ValueError("no races")
+
+    monkeypatch.setattr(day_06, "solve_part_1", solve_part_1)
+    results = runner.solve_phases(day_06, 1, EXAMPLE_INPUT)
+    assert [result["phase"] for result in results] == ["parse", "solve"]
+    assert "error" not in results[0]
+    assert results[1] == {
+        "phase": "solve",
+        "part": 1,
+        "error": "ValueError: no races",
+    }
+
+
+def test_run_task_reports_missing_input(tmp_path: Path) -> None:
+    (result,) = runner.run_task(("day_06", 1), str(tmp_path), use_cache=False)
+    assert result["day"] == "day_06"
+    assert result["error"].startswith("FileNotFoundError")
+
+
+def test_run_tasks_reports_every_part(data_directory: str) -> None:
+    tasks = [("day_05", 1), ("day_06", 2), ("day_06", 1)]
+    results = runner.run_tasks(tasks, data_directory, 2, use_cache=False)
+    assert [(result["day"], result["part"], result["phase"]) for result in results] == [
+        ("day_05", 1, "solve"),
+        ("day_06", 1, "parse"),
+        ("day_06", 1, "solve"),
+        ("day_06", 2, "parse"),
+        ("day_06", 2, "solve"),
+    ]
+    assert "error" in results[0]
+    assert [result["answers"] for result in results[2::2]] == [[288], [71503]]